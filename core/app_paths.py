@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 import shutil
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, List
 
 
 def _is_portable_mode(base_dir: Path) -> bool:
@@ -65,22 +65,25 @@ def get_writable_data_dir(base_dir: Path, *, app_name: str = "carx-drift-editor"
     return data_dir
 
 
-def migrate_portable_files_if_needed(base_dir: Path, target_dir: Path, filenames: Iterable[str]) -> None:
+def migrate_portable_files_if_needed(base_dir: Path, target_dir: Path, filenames: Iterable[str]) -> List[str]:
     """Copy known JSON DB files from <base_dir>/data into `target_dir` once.
 
-    Only copies when source exists and destination does not exist.
+    Only copies when source exists and destination does not exist. Returns a
+    "<name>: <error>" line per file that failed to copy (empty on success).
     """
     src_dir = Path(base_dir) / "data"
     if not src_dir.exists():
-        return
+        return []
     target_dir = Path(target_dir)
     target_dir.mkdir(parents=True, exist_ok=True)
 
+    failures: List[str] = []
     for name in filenames:
         try:
             src = src_dir / name
             dst = target_dir / name
             if src.exists() and not dst.exists():
                 shutil.copy2(src, dst)
-        except Exception:
-            continue
+        except Exception as e:
+            failures.append(f"{name}: {e}")
+    return failures
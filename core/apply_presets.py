@@ -35,41 +35,17 @@ def _score_block(obj: Any, update_keys: Set[str]) -> BlockMatch:
     score = sum(1 for k in update_keys if k in present)
     return score, present
 
-def apply_updates_to_blocks(
-    extracted_dir: Path,
-    updates: Dict[str, object],
-    *,
-    target_best_only: bool = True,
-    per_key_target: bool = True,
-    create_missing_root: bool = False,
-    update_all_occurrences: bool = True,
-) -> Tuple[int, List[str], List[str]]:
-    """
-    Apply updates into extracted UTF-16LE JSON blocks.
-
-    Behavior:
-      - Builds a set of candidate blocks that parse as JSON.
-      - Scores blocks by how many update keys they contain.
-      - If per_key_target=True (recommended): chooses the best block per key and applies only that key there.
-      - If create_missing_root=True: when a key is not found in any block, it is created at the root of the best block.
-
-    Returns:
-      (total_assignments, warnings, touched_files)
-    """
-    setter = set_all_keys if update_all_occurrences else set_first_keys
-
-    warnings: List[str] = []
-    touched: List[str] = []
-    total_assignments = 0
-
-    blocks_dir = extracted_dir / "blocks"
-    if not blocks_dir.exists():
-        return 0, ["Missing blocks/ directory; run extract first."], []
+@dataclass
+class UpdateBatch:
+    """One domain's updates for apply_update_batches_to_blocks()."""
+    updates: Dict[str, object]
+    update_all_occurrences: bool = True
+    label: str = ""
 
-    update_keys = set(updates.keys())
-    candidates: List[Tuple[Path, int, Set[str], Any]] = []
 
-    # Load all extracted files; keep only those that parse as JSON.
+def _scan_json_blocks(blocks_dir: Path) -> List[Tuple[Path, Set[str], Any]]:
+    """Parse every extracted block once; return (path, present_keys, obj) for JSON blocks."""
+    out: List[Tuple[Path, Set[str], Any]] = []
     for p in sorted(blocks_dir.glob("*")):
         try:
             txt = read_text_any(p)
@@ -78,15 +54,42 @@ def apply_updates_to_blocks(
                 continue
         except Exception:
             continue
-
         present: Set[str] = set()
         _collect_keys(obj, present)
+        out.append((p, present, obj))
+    return out
+
+
+def _anchor_score(present: Set[str]) -> int:
+    anchors = {
+        "coins", "ratingPoints", "playerExp",
+        "availableCars", "availableTracks", "availableProfiles",
+        "m_items", "m_cars",
+        "m_completedTasks", "m_slotLimitPerCar",
+        "<quests>k__BackingField", "hasUpdatedQuests",
+    }
+    return sum(1 for a in anchors if a in present)
+
+
+def _plan_assignments(
+    blocks: List[Tuple[Path, Set[str], Any]],
+    updates: Dict[str, object],
+    *,
+    target_best_only: bool,
+    per_key_target: bool,
+    create_missing_root: bool,
+) -> Tuple[Dict[Path, Dict[str, Any]], List[str]]:
+    """Decide which block(s) receive which keys. Returns (assignments_by_path, warnings)."""
+    warnings: List[str] = []
+    update_keys = set(updates.keys())
+    candidates: List[Tuple[Path, int, Set[str]]] = []
+    for p, present, _obj in blocks:
         score = sum(1 for k in update_keys if k in present)
         if score > 0:
-            candidates.append((p, score, present, obj))
+            candidates.append((p, score, present))
 
     if not candidates:
-        return 0, ["No JSON blocks contained any of the requested keys. The save may store fields under different names."], []
+        return {}, ["No JSON blocks contained any of the requested keys. The save may store fields under different names."]
 
     # Sort by score desc, then by filename for stability.
     candidates.sort(key=lambda t: (-t[1], t[0].name))
@@ -99,17 +102,6 @@ def apply_updates_to_blocks(
             f"per_key_target={'on' if per_key_target else 'off'}."
         )
 
-    def _anchor_score(present: Set[str]) -> int:
-        anchors = {
-            "coins", "ratingPoints", "playerExp",
-            "availableCars", "availableTracks", "availableProfiles",
-            "m_items", "m_cars",
-            "m_completedTasks", "m_slotLimitPerCar",
-            "<quests>k__BackingField", "hasUpdatedQuests",
-        }
-        return sum(1 for a in anchors if a in present)
-
-    # Decide which block(s) to touch.
     assignments_by_path: Dict[Path, Dict[str, Any]] = {}
 
     if per_key_target:
@@ -123,37 +115,120 @@ def apply_updates_to_blocks(
             assignments_by_path.setdefault(cands[0][0], {})[k] = v
     else:
         targets = [best[0]] if target_best_only else best
-        for p, score, present, obj in targets:
+        for p, _score, _present in targets:
             assignments_by_path.setdefault(p, {}).update(updates)
 
-    # Apply updates
-    for p, kv in assignments_by_path.items():
-        try:
-            txt0 = read_text_any(p)
-            obj0 = try_load_json(txt0)
-            if obj0 is None:
-                continue
+    return assignments_by_path, warnings
+
+
+def apply_update_batches_to_blocks(
+    extracted_dir: Path,
+    batches: List[UpdateBatch],
+    *,
+    target_best_only: bool = True,
+    per_key_target: bool = True,
+    create_missing_root: bool = False,
+) -> Tuple[int, List[str], List[str]]:
+    """Apply several domains' updates with one parse and one write per block.
+
+    Each batch is planned independently (same targeting rules as
+    apply_updates_to_blocks), then all assignments for a block are applied to a
+    single in-memory object and written once.
+
+    Returns:
+      (total_assignments, warnings, touched_files)
+    """
+    blocks_dir = extracted_dir / "blocks"
+    if not blocks_dir.exists():
+        return 0, ["Missing blocks/ directory; run extract first."], []
 
-            n = setter(obj0, kv)
+    blocks = _scan_json_blocks(blocks_dir)
+    by_path = {p: obj for p, _present, obj in blocks}
 
-            if create_missing_root and isinstance(obj0, dict):
-                present_keys: Set[str] = set()
-                _collect_keys(obj0, present_keys)
-                for k, v in kv.items():
-                    if k not in present_keys:
-                        obj0[k] = v
-                        n += 1
+    warnings: List[str] = []
+    # path -> [(batch index, kv, setter)] in batch order
+    per_path: Dict[Path, List[Tuple[int, Dict[str, Any], Any]]] = {}
+    planned: Set[int] = set()
+    for i, batch in enumerate(batches):
+        if not batch.updates:
+            continue
+        plan, w = _plan_assignments(
+            blocks,
+            batch.updates,
+            target_best_only=target_best_only,
+            per_key_target=per_key_target,
+            create_missing_root=create_missing_root,
+        )
+        prefix = f"{batch.label}: " if batch.label else ""
+        warnings.extend(prefix + x for x in w)
+        if plan:
+            planned.add(i)
+        setter = set_all_keys if batch.update_all_occurrences else set_first_keys
+        for p, kv in plan.items():
+            per_path.setdefault(p, []).append((i, kv, setter))
 
-            if n <= 0:
+    total_assignments = 0
+    touched: List[str] = []
+    per_batch_n: Dict[int, int] = {}
+    for p, steps in per_path.items():
+        obj0 = by_path.get(p)
+        if obj0 is None:
+            continue
+        try:
+            n_block = 0
+            for i, kv, setter in steps:
+                n = setter(obj0, kv)
+                if create_missing_root and isinstance(obj0, dict):
+                    present_keys: Set[str] = set()
+                    _collect_keys(obj0, present_keys)
+                    for k, v in kv.items():
+                        if k not in present_keys:
+                            obj0[k] = v
+                            n += 1
+                per_batch_n[i] = per_batch_n.get(i, 0) + n
+                n_block += n
+
+            if n_block <= 0:
                 continue
 
-            new_txt = dump_json_compact(obj0)
-            write_text_utf16le(p, new_txt)
-            total_assignments += n
+            write_text_utf16le(p, dump_json_compact(obj0))
+            total_assignments += n_block
             touched.append(str(p))
         except Exception:
             continue
 
-    if total_assignments == 0:
-        warnings.append("No assignments were performed even though matching keys were detected.")
-    return total_assignments, warnings, touched
\ No newline at end of file
+    for i, batch in enumerate(batches):
+        if i in planned and not per_batch_n.get(i):
+            prefix = f"{batch.label}: " if batch.label else ""
+            warnings.append(prefix + "No assignments were performed even though matching keys were detected.")
+    return total_assignments, warnings, touched
+
+
+def apply_updates_to_blocks(
+    extracted_dir: Path,
+    updates: Dict[str, object],
+    *,
+    target_best_only: bool = True,
+    per_key_target: bool = True,
+    create_missing_root: bool = False,
+    update_all_occurrences: bool = True,
+) -> Tuple[int, List[str], List[str]]:
+    """
+    Apply updates into extracted UTF-16LE JSON blocks.
+
+    Behavior:
+      - Builds a set of candidate blocks that parse as JSON.
+      - Scores blocks by how many update keys they contain.
+      - If per_key_target=True (recommended): chooses the best block per key and applies only that key there.
+      - If create_missing_root=True: when a key is not found in any block, it is created at the root of the best block.
+
+    Returns:
+      (total_assignments, warnings, touched_files)
+    """
+    return apply_update_batches_to_blocks(
+        extracted_dir,
+        [UpdateBatch(dict(updates), update_all_occurrences=update_all_occurrences)],
+        target_best_only=target_best_only,
+        per_key_target=per_key_target,
+        create_missing_root=create_missing_root,
+    )
@@ -4,7 +4,7 @@ import json
 import os
 import tempfile
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Callable
 
 
 def _atomic_write_bytes_qt(path: Path, data: bytes) -> bool:
@@ -56,6 +56,28 @@ def atomic_write_bytes(path: Path, data: bytes) -> None:
             pass
 
 
+def atomic_write_stream(path: Path, fill: Callable[[BinaryIO], None]) -> None:
+    """Atomically write `path` by letting `fill` stream into a temp file.
+
+    Unlike atomic_write_bytes(), the full payload never has to exist in memory.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=path.name + ".", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            fill(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    finally:
+        try:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+        except Exception:
+            pass
+
+
 def atomic_write_text(path: Path, text: str, *, encoding: str = "utf-8", newline: str = "") -> None:
     """Atomically write text to `path`."""
     data = (text if newline is None else text.replace("\n", newline)).encode(encoding)
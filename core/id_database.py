@@ -5,9 +5,9 @@ import json
 from .app_paths import get_writable_data_dir
 from .fs_atomic import atomic_write_json
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 @dataclass
@@ -25,6 +25,18 @@ class IdDatabase:
 
     # Path used for persistence when loaded via :meth:`load_default`.
     _path: Optional[Path] = None
+    # Set by the *_deferred setters; cleared by save().
+    _dirty: bool = False
+    # label_car() results; the car setters below drop affected entries.
+    _car_label_cache: Dict[str, str] = field(default_factory=dict, repr=False)
+    # Bumped by every label setter so views can tell their cached rows are stale.
+    _version: int = field(default=0, repr=False)
+    # search_index() results per kind, tagged with the _version they were built at.
+    _search_index: Dict[str, Tuple[int, Dict[str, Tuple[str, str]]]] = field(default_factory=dict, repr=False)
+
+    @property
+    def version(self) -> int:
+        return self._version
 
     @classmethod
     def load_default(cls, base_dir: Path) -> "IdDatabase":
@@ -106,6 +118,7 @@ class IdDatabase:
         """
         if not self._path:
             return
+        self._dirty = False
         try:
             self._path.parent.mkdir(parents=True, exist_ok=True)
             atomic_write_json(
@@ -125,16 +138,49 @@ class IdDatabase:
     def set_key_label(self, key: str, label: str) -> None:
         k = str(key)
         self.key_labels[k] = str(label)
+        self._version += 1
         self.save()
 
+    def clear_key_label(self, key: str) -> None:
+        k = str(key)
+        if k in self.key_labels:
+            del self.key_labels[k]
+            self._version += 1
+            self.save()
+
     def set_car_label(self, car_id: Any, name: str) -> None:
         s = str(car_id)
         self.cars[s] = str(name)
+        self._car_label_cache.pop(s, None)
+        self._version += 1
         self.save()
 
+    def set_car_labels_bulk(self, labels: Dict[str, str]) -> None:
+        """Update many car labels and persist them with a single save()."""
+        if not labels:
+            return
+        self.cars.update({str(k): str(v) for k, v in labels.items()})
+        self._car_label_cache.clear()
+        self._version += 1
+        self.save()
+
+    def set_car_label_deferred(self, car_id: Any, name: str) -> None:
+        """Update a car label in memory only; call :meth:`flush` to persist."""
+        s = str(car_id)
+        self.cars[s] = str(name)
+        self._car_label_cache.pop(s, None)
+        self._version += 1
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Persist pending deferred edits (no-op when nothing changed)."""
+        if self._dirty:
+            self.save()
+
     def set_track_label(self, track_id: Any, name: str) -> None:
         s = str(track_id)
         self.tracks[s] = str(name)
+        self._version += 1
         self.save()
 
     def label_key(self, key: str) -> str:
@@ -142,8 +188,31 @@ class IdDatabase:
 
     def label_car(self, car_id: Any) -> str:
         s = str(car_id)
-        return self.cars.get(s, f"Car {s}")
+        label = self._car_label_cache.get(s)
+        if label is None:
+            label = self._car_label_cache[s] = self.cars.get(s, f"Car {s}")
+        return label
+
+    def label_cars_bulk(self, car_ids: Any) -> Dict[str, str]:
+        """Return {str(id): label} for many car IDs in one pass (duplicates collapse)."""
+        cars = self.cars
+        return {s: cars.get(s, f"Car {s}") for s in map(str, car_ids)}
 
     def label_track(self, track_id: Any) -> str:
         s = str(track_id)
         return self.tracks.get(s, f"Track {s}")
+
+    def search_index(self, kind: str) -> Dict[str, Tuple[str, str]]:
+        """Return {id: (label, lowercased "id\\x00label")} for "cars" or "tracks".
+
+        Built once per database version so list filters can test one prebuilt
+        string per id; the NUL separator keeps a query from matching across
+        the id/label boundary. Treat the result as read-only.
+        """
+        cached = self._search_index.get(kind)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        labels = self.cars if kind == "cars" else self.tracks
+        index = {k: (v, f"{k}\x00{v}".lower()) for k, v in labels.items()}
+        self._search_index[kind] = (self._version, index)
+        return index
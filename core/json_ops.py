@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import json
+import math
+import re
 from pathlib import Path
 import copy
 
-from .fs_atomic import atomic_write_bytes
+from .fs_atomic import atomic_write_bytes, atomic_write_stream
 
 from typing import Any, Dict, List, Tuple, Set, Optional
 
+try:  # Optional fast parser; interns short object keys and is much faster on big blocks.
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None
+
 # Small, process-local cache for extracted block files. Large CarX saves can
 # contain hundreds of UTF-16LE JSON blocks totaling 80+ MB. Several UI tabs read
 # the same blocks during one load; caching by (path, mtime, size) removes the
@@ -17,6 +24,9 @@ _TEXT_CACHE: Dict[str, Tuple[int, int, str]] = {}
 _JSON_CACHE: Dict[str, Tuple[int, int, Any]] = {}
 _MAX_CACHED_FILE_BYTES = 12 * 1024 * 1024
 
+# Digit runs that may not fit an int64; see try_load_json().
+_LONG_DIGIT_RUN = re.compile(r"\d{19,}")
+
 
 def _file_sig(path: Path) -> Tuple[str, int, int]:
     st = path.stat()
@@ -60,16 +70,18 @@ def read_text_any(path: Path) -> str:
     if cached is not None and cached[0] == mtime_ns and cached[1] == size:
         return cached[2]
 
-    b = path.read_bytes()
+    text = _decode_text_bytes(path.read_bytes())
+    if size <= _MAX_CACHED_FILE_BYTES:
+        _TEXT_CACHE[key] = (mtime_ns, size, text)
+    return text
+
 
+def _decode_text_bytes(b: bytes) -> str:
+    """Decode file bytes with the UTF-8 / UTF-16LE heuristic of read_text_any()."""
     # UTF-16LE BOM
-    text: str
     if b.startswith(b"\xff\xfe"):
         try:
-            text = b.decode("utf-16le")
-            if size <= _MAX_CACHED_FILE_BYTES:
-                _TEXT_CACHE[key] = (mtime_ns, size, text)
-            return text
+            return b.decode("utf-16le")
         except UnicodeDecodeError:
             pass
 
@@ -77,26 +89,19 @@ def read_text_any(path: Path) -> str:
     nul = b.count(b"\x00")
     if nul > max(16, len(b) // 10):
         try:
-            text = b.decode("utf-16le")
-            if size <= _MAX_CACHED_FILE_BYTES:
-                _TEXT_CACHE[key] = (mtime_ns, size, text)
-            return text
+            return b.decode("utf-16le")
         except UnicodeDecodeError:
             pass
 
     # Prefer UTF-8
     try:
-        text = b.decode("utf-8")
+        return b.decode("utf-8")
     except UnicodeDecodeError:
         # Fallback to UTF-16LE
         try:
-            text = b.decode("utf-16le")
+            return b.decode("utf-16le")
         except UnicodeDecodeError:
-            text = b.decode("utf-8", errors="replace")
-
-    if size <= _MAX_CACHED_FILE_BYTES:
-        _TEXT_CACHE[key] = (mtime_ns, size, text)
-    return text
+            return b.decode("utf-8", errors="replace")
 
 
 def write_text_utf16le(path: Path, s: str) -> None:
@@ -106,13 +111,49 @@ def write_text_utf16le(path: Path, s: str) -> None:
     atomic_write_bytes(path, data)
     _invalidate_path(path)
 
+# Characters encoded per write() by write_json_utf16le().
+_UTF16_WRITE_CHUNK_CHARS = 1 << 20
+
+
+def write_json_utf16le(path: Path, obj: Any) -> None:
+    """Write `obj` as compact UTF-16LE JSON (same bytes as write_text_utf16le(path, dump_json_compact(obj))).
+
+    The str comes from the C encoder (json.dump() into a text stream would use
+    the much slower pure-Python iterencode); only its UTF-16LE encoding is
+    streamed, in slices, so the full encoded copy never exists in memory.
+    """
+    text = dump_json_compact(obj)
+
+    def _fill(f) -> None:
+        n = _UTF16_WRITE_CHUNK_CHARS
+        for i in range(0, len(text), n):
+            f.write(text[i:i + n].encode("utf-16le"))
+
+    _invalidate_path(path)
+    atomic_write_stream(path, _fill)
+    _invalidate_path(path)
+
 def try_load_json(text: str) -> Any:
     # tolerate UTF-8 BOM
     if text and text[0] == "\ufeff":
         text = text[1:]
+    # orjson silently turns integers outside the 64-bit range into floats, which
+    # would then be written back as floats; any 19+ digit run (int64 has at most
+    # 19 digits) sends the text to the stdlib parser, which keeps exact ints.
+    if _orjson is not None and _LONG_DIGIT_RUN.search(text) is None:
+        try:
+            return _orjson.loads(text)
+        except _orjson.JSONDecodeError:
+            # orjson is stricter (NaN/Infinity literals); let stdlib decide.
+            pass
     return json.loads(text)
 
 
+def try_load_json_bytes(data: bytes) -> Any:
+    """Parse JSON from raw file bytes (UTF-8 or UTF-16LE, as read_text_any())."""
+    return try_load_json(_decode_text_bytes(data))
+
+
 def load_json_file_cached(path: Path, *, copy_obj: bool = False) -> Any:
     """Load a JSON file with a path-aware cache.
 
@@ -133,6 +174,40 @@ def load_json_file_cached(path: Path, *, copy_obj: bool = False) -> Any:
 def dump_json_compact(obj: Any) -> str:
     return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
 
+def _has_non_finite_float(obj: Any) -> bool:
+    """True if `obj` holds a NaN/Infinity float anywhere (iterative walk)."""
+    stack = [obj]
+    while stack:
+        x = stack.pop()
+        t = type(x)
+        if t is float:
+            if not math.isfinite(x):
+                return True
+        elif t is dict:
+            stack.extend(x.values())
+        elif t is list or t is tuple:
+            stack.extend(x)
+    return False
+
+
+def dump_json_pretty_bytes(obj: Any) -> bytes:
+    """Two-space indented UTF-8 JSON for the small user-data DB files.
+
+    orjson (when available) produces the bytes directly, skipping the
+    intermediate str and its re-encode. Its output parses back to the same
+    values as the stdlib's, but is not byte-identical: floats may be spelled
+    differently (``1e20`` vs ``1e+20``). orjson writes NaN/Infinity as
+    ``null``, so values containing them go through the stdlib encoder, which
+    keeps them.
+    """
+    if _orjson is not None and not _has_non_finite_float(obj):
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson.JSONEncodeError (>64-bit ints, odd types); stdlib handles those.
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 def set_all_keys(obj: Any, updates: Dict[str, Any]) -> int:
     changed = 0
     if isinstance(obj, dict):
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import hashlib
+import mmap
+import shutil
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 from .model import BlockInfo
 from .json_ops import dump_json_compact, read_text_any, try_load_json
@@ -44,6 +46,59 @@ def _is_untouched(bi: BlockInfo, extracted_dir: Path) -> bool:
         return False
 
 
+def _map_readonly(path: Path) -> Union[mmap.mmap, bytes]:
+    """Map a file read-only (bytes-like; slicing returns bytes). Empty files yield b""."""
+    with open(path, "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Zero-length files cannot be mapped.
+            return b""
+
+
+def _close_mapping(data: Union[mmap.mmap, bytes]) -> None:
+    if isinstance(data, mmap.mmap):
+        data.close()
+
+
+def _coalesce_patches(patches: List[Tuple[int, bytes]]) -> List[Tuple[int, bytes]]:
+    """Sort patches by offset and join back-to-back ones into a single write."""
+    merged: List[Tuple[int, bytes]] = []
+    run_off = -1
+    run: List[bytes] = []
+    run_end = -1
+    for off, buf in sorted(patches, key=lambda t: t[0]):
+        if run and off == run_end:
+            run.append(buf)
+            run_end += len(buf)
+            continue
+        if run:
+            merged.append((run_off, b"".join(run)))
+        run_off, run, run_end = off, [buf], off + len(buf)
+    if run:
+        merged.append((run_off, b"".join(run)))
+    return merged
+
+
+def _write_patched_copy(base_memory_dat: Path, out_path: Path, patches: List[Tuple[int, bytes]]) -> None:
+    """Copy the base file to out_path, then patch slot regions in place through mmap.
+
+    Unchanged regions are never read into Python; only the dirty pages of the
+    patched slots are written back by the kernel.
+    """
+    shutil.copyfile(base_memory_dat, out_path)
+    if not patches:
+        return
+    with open(out_path, "r+b") as f:
+        mm = mmap.mmap(f.fileno(), 0)
+        try:
+            for off, buf in _coalesce_patches(patches):
+                mm[off : off + len(buf)] = buf
+            mm.flush()
+        finally:
+            mm.close()
+
+
 def _validate_base_region(bi: BlockInfo, base_data: bytes) -> None:
     """Extra guardrail: ensure the base file still matches the extracted manifest per-region."""
     if not bi.region_sha1:
@@ -129,7 +184,22 @@ def repack_preflight(
     container = str(manifest.get("container", "h4si"))
     blocks = [BlockInfo(**b) for b in manifest.get("blocks", [])]
 
-    base_data = base_memory_dat.read_bytes()
+    base_data = _map_readonly(base_memory_dat)
+    try:
+        return _repack_preflight(base_memory_dat, extracted_dir, manifest, container, blocks, base_data, payloads_out)
+    finally:
+        _close_mapping(base_data)
+
+
+def _repack_preflight(
+    base_memory_dat: Path,
+    extracted_dir: Path,
+    manifest: Dict,
+    container: str,
+    blocks: List[BlockInfo],
+    base_data: Union[mmap.mmap, bytes],
+    payloads_out: Optional[Dict[int, bytes]],
+) -> Tuple[List[PreflightItem], Path]:
     base_sig = hashlib.sha1(base_data).hexdigest()
     if manifest.get("base_sig") and manifest["base_sig"] != base_sig:
         raise ValueError("Base file does not match extracted manifest (signature mismatch). Please re-extract.")
@@ -227,12 +297,28 @@ def repack(base_memory_dat: Path, extracted_dir: Path, out_path: Path) -> Tuple[
     container = str(manifest.get("container", "h4si"))
     blocks = [BlockInfo(**b) for b in manifest.get("blocks", [])]
 
-    base_data = base_memory_dat.read_bytes()
+    base_data = _map_readonly(base_memory_dat)
+    try:
+        return _repack(base_memory_dat, extracted_dir, out_path, manifest, container, blocks, base_data)
+    finally:
+        _close_mapping(base_data)
+
+
+def _repack(
+    base_memory_dat: Path,
+    extracted_dir: Path,
+    out_path: Path,
+    manifest: Dict,
+    container: str,
+    blocks: List[BlockInfo],
+    base_data: Union[mmap.mmap, bytes],
+) -> Tuple[int, int, List[str], Path]:
     base_sig = hashlib.sha1(base_data).hexdigest()
     if manifest.get("base_sig") and manifest["base_sig"] != base_sig:
         raise ValueError("Base file does not match extracted manifest (signature mismatch). Please re-extract.")
 
-    out = bytearray(base_data)
+    # (offset, bytes) slot patches; the output is a copy of the base with these applied.
+    patches: List[Tuple[int, bytes]] = []
     report_lines: List[str] = []
     warnings: List[str] = []
     ok = 0
@@ -282,7 +368,7 @@ def repack(base_memory_dat: Path, extracted_dir: Path, out_path: Path) -> Tuple[
                 if len(final) != bi.stored_len:
                     final = final[: bi.stored_len] + (b"\\x00" * max(0, bi.stored_len - len(final)))
 
-                out[bi.offset : bi.offset + bi.stored_len] = final
+                patches.append((bi.offset, final))
                 ok += 1
                 report_lines.append(f"[OK] block {bi.index:02d} @0x{bi.offset:08X}: wrote {new_len}, cap {cap}, tail {len(tail)}")
             else:
@@ -295,7 +381,7 @@ def repack(base_memory_dat: Path, extracted_dir: Path, out_path: Path) -> Tuple[
                     report_lines.append(f"[FAIL] {msg}")
                     continue
                 padded = new_b64 + (b" " * (bi.stored_len - new_len))
-                out[bi.offset : bi.offset + bi.stored_len] = padded
+                patches.append((bi.offset, padded))
                 ok += 1
                 report_lines.append(f"[OK] block {bi.index:02d} @0x{bi.offset:08X}: wrote {new_len}, padded {bi.stored_len - new_len}")
 
@@ -306,7 +392,7 @@ def repack(base_memory_dat: Path, extracted_dir: Path, out_path: Path) -> Tuple[
             report_lines.append(f"[FAIL] {msg}")
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_bytes(bytes(out))
+    _write_patched_copy(base_memory_dat, out_path, patches)
 
     report_path = out_path.with_suffix(out_path.suffix + ".rebuild_report.txt")
     report_lines.append("")
@@ -2,20 +2,23 @@ from __future__ import annotations
 
 import hashlib
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
 import json
 import re
+import sys
 
-from PyQt6.QtWidgets import QFileDialog, QMessageBox, QLineEdit, QSpinBox
+from PyQt6.QtCore import QObject, QThread, QTimer, Qt
+from PyQt6.QtWidgets import QFileDialog, QMessageBox, QLineEdit, QSpinBox, QStackedWidget
 
-from core.extract import extract
-from core.repack import repack, repack_preflight
-from core.apply_presets import apply_updates_to_blocks
+from core.repack import repack_preflight
+from core.apply_presets import UpdateBatch, apply_update_batches_to_blocks, apply_updates_to_blocks
 from core.json_ops import read_text_any, try_load_json, load_json_file_cached, find_first_keys, dump_json_compact, write_text_utf16le
 from core.scan_ids import scan_extracted_dir
 from core.observed_db import ObservedDb
 
+from ui.actions.workers import ExtractWorker, RepackWorker
+
 
 class ActionsMixin:
     """MainWindow mixin for project actions and extracted-save helpers.
@@ -29,12 +32,31 @@ class ActionsMixin:
     # Logging
     # ---------------------------
 
+    def _setup_logging(self) -> None:
+        """Route _msg through a queued signal so any thread may log safely."""
+        self._log_buf: list[str] = []
+        self._log_flush_pending = False
+        self.log_signal.connect(self._msg_slot, Qt.ConnectionType.QueuedConnection)
+
     def _msg(self, s: str) -> None:
         """Lightweight logger.
 
         The UI log panel was removed; keep logging available via stdout.
+        Lines are queued to the GUI thread and written once per event-loop tick.
         """
-        print(str(s))
+        self.log_signal.emit(str(s))
+
+    def _msg_slot(self, s: str) -> None:
+        self._log_buf.append(s)
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            QTimer.singleShot(16, self._flush_log)
+
+    def _flush_log(self) -> None:
+        self._log_flush_pending = False
+        buf, self._log_buf = self._log_buf, []
+        if buf:
+            print("\n".join(buf))
 
     # ---------------------------
     # Formatting
@@ -139,6 +161,8 @@ class ActionsMixin:
 
     def on_open_file(self) -> None:
         """Open a memory*.dat file, then auto-extract + auto-load values."""
+        if self._worker_busy():
+            return
         start_dir = ""
         try:
             if getattr(self, "base_dat", None):
@@ -189,34 +213,20 @@ class ActionsMixin:
         This is the primary workflow button/shortcut. It applies Currency + Unlocks + Stats
         into the extracted JSON blocks first, then repacks.
         """
-        # Ensure any debounced auto-sync edits are flushed to extracted blocks
-        try:
-            if hasattr(self, "_flush_auto_apply"):
-                self._flush_auto_apply()
-        except Exception:
-            pass
-
-        # Apply without reloading UI for each step (faster + avoids flicker)
-        try:
-            self.on_apply_currency(silent=True, reload_ui=False)
-        except Exception:
-            pass
+        # Don't touch extracted blocks while a background repack is reading them.
+        if self._worker_busy():
+            return
 
-        # Garage unlocks
+        # The batched apply below already includes currency, so drop any queued
+        # auto-apply rather than flushing it as a separate pass.
         try:
-            if hasattr(self, "garage_unlocks_tab") and hasattr(self, "_on_apply_garage_unlocks_requested"):
-                payload = self.garage_unlocks_tab.get_payload()
-                self._on_apply_garage_unlocks_requested(payload, reload_ui=False)
+            if hasattr(self, "_discard_auto_apply"):
+                self._discard_auto_apply()
         except Exception:
             pass
 
-        # Stats/Cups/Points
-        try:
-            if hasattr(self, "stats_tab") and hasattr(self, "_on_apply_stats_requested"):
-                updates = self.stats_tab.get_updates()
-                self._on_apply_stats_requested(updates, reload_ui=False)
-        except Exception:
-            pass
+        # Currency + Unlocks + Stats in one pass over the extracted blocks.
+        self._apply_pending_edits()
 
         # Car Slots (slot limits)
         try:
@@ -232,8 +242,7 @@ class ActionsMixin:
     def on_extract_and_load(self) -> None:
         # Avoid refreshing schema/browser tabs twice. on_load_values() does the
         # full UI refresh after extraction.
-        self.on_extract(refresh_ui=False)
-        self.on_load_values()
+        self.on_extract(refresh_ui=False, then=self.on_load_values)
 
     # ---------------------------
     # Load values
@@ -258,7 +267,7 @@ class ActionsMixin:
         # Initial load should be fast. Only scan scalar fields needed by the
         # visible quick-edit forms. Large list-heavy tabs (garage, engine parts,
         # car slots, advanced unlocks, raw browser) are lazy-loaded when opened.
-        keys = [
+        keys = [sys.intern(k) for k in (
             # Currency
             "coins",
             "ratingPoints",
@@ -275,7 +284,7 @@ class ActionsMixin:
             "cups1",
             "cups2",
             "cups3",
-        ]
+        )]
 
         found: Dict[str, Any] = {}
         blocks_dir = self.work_dir / "blocks"
@@ -349,6 +358,10 @@ class ActionsMixin:
             _set_line(self.rating_edit, found["ratingPoints"])
         if "playerExp" in found:
             _set_line(self.player_exp_edit, found["playerExp"])
+        try:
+            self._snapshot_currency()
+        except Exception:
+            pass
 
         # Delegate stats to the tab.
         if getattr(self, "stats_tab", None):
@@ -388,51 +401,75 @@ class ActionsMixin:
     # Extract / apply / repack
     # ---------------------------
 
-    def on_extract(self, *, refresh_ui: bool = True) -> None:
+    def on_extract(self, *, refresh_ui: bool = True, then: Optional[Callable[[], None]] = None) -> None:
+        """Extract base_dat into work_dir on a worker thread.
+
+        `then` runs on the GUI thread after a successful extract (used by
+        Extract + Load Values to chain the value load).
+        """
+        if self._worker_busy():
+            return
         if not self._ensure_ready():
             return
-        try:
-            self._msg("Extracting...")
-            manifest = extract(self.base_dat, self.work_dir)
-            self._msg(f"Extract complete: {manifest}")
-
-            # NOTE:
-            # We intentionally do *not* call _populate_fields_from_save() here.
-            # The primary workflow uses "Extract + Load Values" which calls
-            # on_extract() followed by on_load_values(). Calling populate here
-            # would cause redundant refreshes (and in turn redundant EngineParts
-            # DB loads/log spam) during a single user action.
-
-            if refresh_ui:
-                try:
-                    self._mark_extracted_views_stale()
-                    self._refresh_active_lazy_tab()
-                except Exception:
-                    pass
-        except Exception as e:
-            QMessageBox.critical(self, "Extract failed", str(e))
-            self._msg(f"Extract failed: {e}")
+        self._extract_refresh_ui = refresh_ui
+        self._extract_then = then
+        self._start_worker(
+            ExtractWorker(self.base_dat, self.work_dir),
+            self._on_extract_finished,
+            self._on_extract_failed,
+        )
 
-    def on_apply_currency(self, *, silent: bool = False, reload_ui: bool = True) -> None:
-        if not self._ensure_extracted():
-            return
+    def _on_extract_finished(self, manifest: str) -> None:
+        self._msg(f"Extract complete: {manifest}")
+
+        # NOTE:
+        # We intentionally do *not* call _populate_fields_from_save() here.
+        # The primary workflow uses "Extract + Load Values" which chains
+        # on_load_values() after the extract. Calling populate here
+        # would cause redundant refreshes (and in turn redundant EngineParts
+        # DB loads/log spam) during a single user action.
+
+        if getattr(self, "_extract_refresh_ui", True):
+            try:
+                self._mark_extracted_views_stale()
+                self._refresh_active_lazy_tab()
+            except Exception:
+                pass
+
+        then = getattr(self, "_extract_then", None)
+        self._extract_then = None
+        if then is not None:
+            # Defer until the worker thread has fully wound down so the
+            # continuation sees the controls re-enabled.
+            self._after_worker = then
+
+    def _on_extract_failed(self, err: str) -> None:
+        self._extract_then = None
+        QMessageBox.critical(self, "Extract failed", err)
+        self._msg(f"Extract failed: {err}")
+
+    def _currency_updates(self) -> Dict[str, Any]:
         # NOTE: CarX stores many "numeric" fields as strings. Also, the UI
         # formats values with commas, so strip separators before writing.
         def _digits_only(s: str) -> str:
             s = (s or "").strip().replace(",", "").replace("_", "")
             return "".join(ch for ch in s if ch.isdigit())
 
-        coins_s = str(int(self.coins_spin.value()))
-        rating_s = _digits_only(self.rating_edit.text())
-        exp_s = _digits_only(self.player_exp_edit.text())
-
-        updates = {
-            "coins": coins_s,
-            "ratingPoints": rating_s,
-            "playerExp": exp_s,
+        return {
+            "coins": str(int(self.coins_spin.value())),
+            "ratingPoints": _digits_only(self.rating_edit.text()),
+            "playerExp": _digits_only(self.player_exp_edit.text()),
             # Some builds gate wallet application behind this flag.
             "isDLCMoneyApplied": "True",
         }
+
+    def on_apply_currency(self, *, silent: bool = False, reload_ui: bool = True) -> None:
+        # Don't touch extracted blocks while a background extract/repack uses them.
+        if self._worker_busy():
+            return
+        if not self._ensure_extracted():
+            return
+        updates = self._currency_updates()
         try:
             n, warnings, touched = apply_updates_to_blocks(
                 self.work_dir,
@@ -452,6 +489,54 @@ class ActionsMixin:
             if not silent:
                 self._msg(f"[Currency] Failed: {e}")
 
+    def _apply_pending_edits(self) -> None:
+        """Apply Currency + Unlocks + Stats with a single parse/write per block (Save/Repack)."""
+        if not self._ensure_extracted():
+            return
+
+        batches: list[UpdateBatch] = []
+        try:
+            batches.append(UpdateBatch(self._currency_updates(), label="Currency"))
+        except Exception:
+            pass
+        try:
+            if hasattr(self, "garage_unlocks_tab"):
+                unlock_updates = self._garage_unlock_updates(self.garage_unlocks_tab.get_payload())
+                if unlock_updates:
+                    batches.append(UpdateBatch(unlock_updates, update_all_occurrences=False, label="Unlocks"))
+        except Exception:
+            pass
+        try:
+            if hasattr(self, "stats_tab"):
+                stats_updates = self.stats_tab.get_updates()
+                if isinstance(stats_updates, dict) and stats_updates:
+                    batches.append(UpdateBatch(stats_updates, label="Stats"))
+        except Exception:
+            pass
+
+        if not batches:
+            return
+        try:
+            n, warnings, touched = apply_update_batches_to_blocks(
+                self.work_dir,
+                batches,
+                target_best_only=bool(self.chk_target_best.isChecked()),
+                per_key_target=True,
+                create_missing_root=False,
+            )
+            try:
+                self._snapshot_currency()
+            except Exception:
+                pass
+            if warnings:
+                self._msg("[Apply] " + " | ".join(warnings[:8]))
+            self._msg(
+                f"[Apply] {'+'.join(b.label for b in batches)}: "
+                f"{n} assignments to {len(touched)} block(s)."
+            )
+        except Exception as e:
+            self._msg(f"[Apply] Failed: {e}")
+
     def on_apply_unlocks(self) -> None:
         try:
             self.garage_unlocks_tab.request_apply()
@@ -469,6 +554,8 @@ class ActionsMixin:
     # ---------------------------
 
     def _on_apply_stats_requested(self, updates: dict, reload_ui: bool = True) -> None:
+        if self._worker_busy():
+            return
         if not self._ensure_extracted():
             return
         if not isinstance(updates, dict):
@@ -492,11 +579,40 @@ class ActionsMixin:
             self._msg(f"[Stats] Failed: {e}")
 
     def _on_apply_garage_unlocks_requested(self, payload: dict, reload_ui: bool = True) -> None:
+        if self._worker_busy():
+            return
         if not self._ensure_extracted():
             return
+        updates = self._garage_unlock_updates(payload, reload_ui=reload_ui)
+        if not updates:
+            return
+
+        try:
+            n, warnings, touched = apply_updates_to_blocks(
+                self.work_dir,
+                updates,
+                target_best_only=bool(self.chk_target_best.isChecked()),
+                per_key_target=True,
+                create_missing_root=False,
+                update_all_occurrences=False,
+            )
+            if warnings:
+                self._msg("[Unlocks] " + " | ".join(warnings[:8]))
+            self._msg(f"[Unlocks] Applied {n} assignments to {len(touched)} block(s).")
+            if reload_ui:
+                self._populate_fields_from_save(show_summary=False)
+        except Exception as e:
+            QMessageBox.critical(self, "Apply failed", str(e))
+            self._msg(f"[Unlocks] Failed: {e}")
+
+    def _garage_unlock_updates(self, payload: dict, reload_ui: bool = False) -> Optional[Dict[str, Any]]:
+        """Turn a garage/unlock payload into block updates (None when there is nothing to apply).
+
+        The "inject_unlock_container" op is performed here directly and yields None.
+        """
         if not isinstance(payload, dict):
             self._msg("[Unlocks] Invalid payload")
-            return
+            return None
 
         # Payload supports both legacy and schema-aware formats
         op = payload.get("__op") or payload.get("op")
@@ -616,7 +732,7 @@ class ActionsMixin:
                     self._populate_fields_from_save(show_summary=False)
             else:
                 self._msg(f"[Unlocks] Failed to create container {car_key}/{track_key}")
-            return
+            return None
 
         updates: Dict[str, Any] = {}
 
@@ -631,7 +747,7 @@ class ActionsMixin:
                 f"[Unlocks] Container not found for {car_key}/{track_key}. "
                 "Select the correct Schema in the Garage tab, or click 'Create container'."
             )
-            return
+            return None
 
         merge_mode = bool(payload.get("merge", True))
 
@@ -665,91 +781,139 @@ class ActionsMixin:
 
         if not updates:
             self._msg("[Unlocks] Nothing to apply")
-            return
+            return None
 
+        # Debug summary (helps diagnose schema/type mismatches)
         try:
-            # Debug summary (helps diagnose schema/type mismatches)
+            mode = payload.get("schema_mode") or f"{car_key}/{track_key}"
+            before_c = _get_first_list(car_key)
+            before_t = _get_first_list(track_key)
+            self._msg(
+                f"[Unlocks] Applying schema={mode} merge={merge_mode} "
+                f"car_kind={car_kind} track_kind={track_kind} "
+                f"cars {len(before_c)}→{len(updates.get(car_key, before_c))} "
+                f"tracks {len(before_t)}→{len(updates.get(track_key, before_t))}"
+            )
+        except Exception:
+            pass
+        return updates
+
+    # ---------------------------
+    # Background workers (extract / repack)
+    # ---------------------------
+
+    def _worker_running(self) -> bool:
+        """True while an extract/repack worker owns the blocks folder (no message)."""
+        return getattr(self, "_worker_thread", None) is not None
+
+    def _worker_busy(self) -> bool:
+        if self._worker_running():
+            self._msg("Another extract/repack is still running.")
+            return True
+        return False
+
+    def _start_worker(self, worker: QObject, on_finished: Callable, on_failed: Callable) -> None:
+        """Move `worker` onto a fresh QThread and run it; one worker at a time."""
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.progress.connect(self._msg)
+        worker.finished.connect(on_finished)
+        worker.failed.connect(on_failed)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(self._on_worker_thread_done)
+
+        self._worker_thread = thread
+        self._worker = worker
+        self._set_worker_controls_enabled(False)
+        thread.start()
+
+    def _set_worker_controls_enabled(self, enabled: bool) -> None:
+        """Enable/disable Open/Extract/Save controls and the tab pages while a worker runs.
+
+        Prevents reentry and keeps edits out of the blocks folder the worker is
+        extracting into or repacking from.
+        """
+        for name in ("btn_extract", "btn_save", "act_open", "act_extract_load", "act_save"):
+            w = getattr(self, name, None)
+            if w is not None:
+                try:
+                    w.setEnabled(enabled)
+                except Exception:
+                    pass
+        # Tab pages write blocks directly (engine parts, captions, slots, browser
+        # edits). Disable the page stack, not each page, so tabs that manage their
+        # own enabled state keep it, lazily built tabs inherit the lock, and the
+        # tab bar stays usable.
+        tabs = getattr(self, "tabs", None)
+        if tabs is not None:
             try:
-                mode = payload.get("schema_mode") or f"{car_key}/{track_key}"
-                before_c = _get_first_list(car_key)
-                before_t = _get_first_list(track_key)
-                self._msg(
-                    f"[Unlocks] Applying schema={mode} merge={merge_mode} "
-                    f"car_kind={car_kind} track_kind={track_kind} "
-                    f"cars {len(before_c)}→{len(updates.get(car_key, before_c))} "
-                    f"tracks {len(before_t)}→{len(updates.get(track_key, before_t))}"
-                )
+                stack = tabs.findChild(QStackedWidget, "", Qt.FindChildOption.FindDirectChildrenOnly)
+                if stack is not None:
+                    stack.setEnabled(enabled)
             except Exception:
                 pass
 
-            n, warnings, touched = apply_updates_to_blocks(
-                self.work_dir,
-                updates,
-                target_best_only=bool(self.chk_target_best.isChecked()),
-                per_key_target=True,
-                create_missing_root=False,
-                update_all_occurrences=False,
-            )
-            if warnings:
-                self._msg("[Unlocks] " + " | ".join(warnings[:8]))
-            self._msg(f"[Unlocks] Applied {n} assignments to {len(touched)} block(s).")
-            if reload_ui:
-                self._populate_fields_from_save(show_summary=False)
-        except Exception as e:
-            QMessageBox.critical(self, "Apply failed", str(e))
-            self._msg(f"[Unlocks] Failed: {e}")
+    def _on_worker_thread_done(self) -> None:
+        self._worker_thread = None
+        self._worker = None
+        self._set_worker_controls_enabled(True)
+        after = getattr(self, "_after_worker", None)
+        self._after_worker = None
+        if after is not None:
+            after()
+        # An auto-apply that came due while the worker ran was held back; run it now.
+        if getattr(self, "_auto_apply_pending", False):
+            try:
+                self._auto_apply_timer.start(0)  # type: ignore[attr-defined]
+            except Exception:
+                pass
 
     def on_repack(self) -> None:
+        if self._worker_busy():
+            return
         if not self._ensure_extracted():
             return
 
         # If enabled, apply all pending edits to the extracted blocks before repacking.
         try:
             if hasattr(self, "chk_apply_all") and self.chk_apply_all.isChecked():
-                # Currency
-                try:
-                    if hasattr(self, "on_apply_currency"):
-                        self.on_apply_currency(silent=True, reload_ui=False)  # type: ignore[arg-type]
-                except Exception:
-                    pass
-                # Garage unlocks
-                try:
-                    if hasattr(self, "_on_apply_garage_unlocks_requested") and hasattr(self, "garage_unlocks_tab"):
-                        payload = self.garage_unlocks_tab.get_payload()
-                        self._on_apply_garage_unlocks_requested(payload, reload_ui=False)
-                except Exception:
-                    pass
-                # Stats/Cups/Points
-                try:
-                    if hasattr(self, "_on_apply_stats_requested") and hasattr(self, "stats_tab"):
-                        updates = self.stats_tab.get_updates()
-                        self._on_apply_stats_requested(updates, reload_ui=False)
-                except Exception:
-                    pass
+                self._apply_pending_edits()
         except Exception:
             pass
 
-        try:
-            out_path = self.base_dat.parent / (self.base_dat.stem + "_patched" + self.base_dat.suffix)
-            ok, fail, warnings, report_path = repack(self.base_dat, self.work_dir, out_path)
-            self._msg(f"Repacked: {out_path} (ok={ok}, fail={fail})")
-            msg_lines = [
-                f"Repacked to:\n{out_path}",
-                "",
-                f"Blocks written: {ok}",
-                f"Blocks failed: {fail}",
-                f"Report: {report_path}",
-            ]
-            if warnings:
-                msg_lines.append("")
-                msg_lines.append("Warnings (first 8):")
-                for w in warnings[:8]:
-                    msg_lines.append(f"- {w}")
-            QMessageBox.information(self, "Repack", "\n".join(msg_lines))
-        except Exception as e:
-            QMessageBox.critical(self, "Repack failed", str(e))
-            self._msg(f"Repack failed: {e}")
+        # Repack runs on a worker thread so large saves don't freeze the UI.
+        out_path = self.base_dat.parent / (self.base_dat.stem + "_patched" + self.base_dat.suffix)
+        self._repack_out_path = out_path
+        self._start_worker(
+            RepackWorker(self.base_dat, self.work_dir, out_path),
+            self._on_repack_finished,
+            self._on_repack_failed,
+        )
 
+    def _on_repack_finished(self, ok: int, fail: int, warnings: list, report_path: str) -> None:
+        out_path = getattr(self, "_repack_out_path", None)
+        self._msg(f"Repacked: {out_path} (ok={ok}, fail={fail})")
+        msg_lines = [
+            f"Repacked to:\n{out_path}",
+            "",
+            f"Blocks written: {ok}",
+            f"Blocks failed: {fail}",
+            f"Report: {report_path}",
+        ]
+        if warnings:
+            msg_lines.append("")
+            msg_lines.append("Warnings (first 8):")
+            for w in warnings[:8]:
+                msg_lines.append(f"- {w}")
+        QMessageBox.information(self, "Repack", "\n".join(msg_lines))
+
+    def _on_repack_failed(self, err: str) -> None:
+        QMessageBox.critical(self, "Repack failed", err)
+        self._msg(f"Repack failed: {err}")
 
     def on_repack_preflight(self) -> None:
         """Compute and write a repack preflight report (no output written)."""
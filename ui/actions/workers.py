@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from core.extract import extract
+from core.repack import repack
+
+
+class RepackWorker(QObject):
+    """Run core.repack.repack() off the GUI thread.
+
+    Lives on a QThread owned by MainWindow. Results are delivered through
+    signals, which Qt queues onto the receiver's (GUI) thread, so slots may
+    touch widgets directly.
+    """
+
+    progress = pyqtSignal(str)
+    finished = pyqtSignal(int, int, list, str)  # ok, fail, warnings, report_path
+    failed = pyqtSignal(str)
+
+    def __init__(self, base_dat: Path, work_dir: Path, out_path: Path):
+        super().__init__()
+        self._base_dat = Path(base_dat)
+        self._work_dir = Path(work_dir)
+        self._out_path = Path(out_path)
+
+    def run(self) -> None:
+        try:
+            self.progress.emit(f"Repacking → {self._out_path} ...")
+            ok, fail, warnings, report_path = repack(self._base_dat, self._work_dir, self._out_path)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(int(ok), int(fail), list(warnings), str(report_path))
+
+
+class ExtractWorker(QObject):
+    """Run core.extract.extract() off the GUI thread (same contract as RepackWorker)."""
+
+    progress = pyqtSignal(str)
+    finished = pyqtSignal(str)  # manifest path
+    failed = pyqtSignal(str)
+
+    def __init__(self, base_dat: Path, work_dir: Path):
+        super().__init__()
+        self._base_dat = Path(base_dat)
+        self._work_dir = Path(work_dir)
+
+    def run(self) -> None:
+        try:
+            self.progress.emit("Extracting...")
+            manifest = extract(self._base_dat, self._work_dir)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(str(manifest))
+
+
+class _TabLoadSignals(QObject):
+    loaded = pyqtSignal(int, object, object)  # generation, tab, data
+    failed = pyqtSignal(int, object, str)  # generation, tab, error
+
+
+class TabLoadTask(QRunnable):
+    """Run `tab.load_data(work_dir)` on QThreadPool.
+
+    The signals object is created on the GUI thread, so connected MainWindow
+    slots receive the result there and may call `tab.apply_data(data)`.
+    """
+
+    def __init__(self, generation: int, tab: object, work_dir: Path):
+        super().__init__()
+        self.signals = _TabLoadSignals()
+        self._generation = generation
+        self._tab = tab
+        self._work_dir = Path(work_dir)
+
+    def run(self) -> None:
+        try:
+            data = self._tab.load_data(self._work_dir)  # type: ignore[attr-defined]
+        except Exception as e:
+            self.signals.failed.emit(self._generation, self._tab, str(e))
+            return
+        self.signals.loaded.emit(self._generation, self._tab, data)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import sys
 from pathlib import Path
 from typing import Any, List
 
@@ -180,15 +181,16 @@ class BrowserMixin:
     # ---------------------------
 
     def _browser_player_keys(self) -> List[str]:
-        return [
+        # Interned so membership checks against parsed JSON keys hit the identity fast path.
+        return [sys.intern(k) for k in (
             "coins", "ratingPoints", "playerExp",
             "timeInGame", "racesPlayed", "driftRacesPlayed", "timeAttackRacesPlayed", "MPRacesPlayed",
             "maxPointsPerDrift", "maxPointsPerRace", "averagePointsPerRace",
             "cups1", "cups2", "cups3",
-        ]
+        )]
 
     def _find_keys_in_obj(self, obj: Any, keys: List[str]) -> set:
-        keyset = set(keys)
+        keyset = frozenset(map(sys.intern, keys))
         found = set()
         stack = [obj]
         while stack:
@@ -735,9 +737,7 @@ class BrowserMixin:
                     if not txt:
                         # Clear
                         try:
-                            if raw_key in id_db.key_labels:
-                                del id_db.key_labels[raw_key]
-                                id_db.save()
+                            id_db.clear_key_label(raw_key)
                         except Exception:
                             pass
                     else:
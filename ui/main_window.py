@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import time
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import (
     QApplication,
@@ -19,6 +21,7 @@ from PyQt6.QtWidgets import (
     QPlainTextEdit,
     QSpinBox,
     QMainWindow,
+    QMessageBox,
     QTabWidget,
     QToolBar,
     QVBoxLayout,
@@ -31,6 +34,7 @@ from core.tunes_db import TunesDb
 from core.app_paths import get_writable_data_dir, migrate_portable_files_if_needed
 
 from ui.actions.actions_mixin import ActionsMixin
+from ui.actions.workers import RepackWorker, TabLoadTask
 from ui.browser.browser_mixin import BrowserMixin
 from ui.themes import DEFAULT_THEME, THEME_NAMES, apply_app_theme, is_dark_theme
 
@@ -61,8 +65,12 @@ class MainWindow(ActionsMixin, BrowserMixin, QMainWindow):
       - Avoid indentation/scope regressions that previously caused missing-method crashes.
     """
 
+    # Cross-thread log channel (see ActionsMixin._msg).
+    log_signal = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
+        self._setup_logging()
 
         base_dir = Path(__file__).resolve().parents[1]
         # Keep a stable reference for mixins/tabs that need project-relative paths.
@@ -70,13 +78,25 @@ class MainWindow(ActionsMixin, BrowserMixin, QMainWindow):
 
         # Stable per-user (or portable) editor data directory
         self.data_dir = get_writable_data_dir(base_dir)
-        # One-way migration from old portable <base_dir>/data into per-user dir
-        migrate_portable_files_if_needed(base_dir, self.data_dir, [
-            "id_database.json",
-            "favorites.json",
-            "engine_parts_db.json",
-            "tunes_db.json",
-        ])
+        # One-way migration from old portable <base_dir>/data into per-user dir.
+        # The marker lets later launches skip the stat calls entirely; it is only
+        # written once every file migrated, so a failed copy is retried next launch.
+        migration_marker = Path(self.data_dir) / ".migrated_v1"
+        if not migration_marker.exists():
+            try:
+                failures = migrate_portable_files_if_needed(base_dir, self.data_dir, [
+                    "id_database.json",
+                    "favorites.json",
+                    "engine_parts_db.json",
+                    "tunes_db.json",
+                ])
+                if failures:
+                    for line in failures:
+                        self._msg(f"[Migrate] Failed to copy {line}")
+                else:
+                    migration_marker.touch()
+            except Exception as e:
+                self._msg(f"[Migrate] Failed: {e}")
         self.id_db = IdDatabase.load_default(base_dir)
         self.favorites_db = FavoritesDb.load_default(base_dir)
         self.tune_db = TunesDb(base_dir)
@@ -85,21 +105,56 @@ class MainWindow(ActionsMixin, BrowserMixin, QMainWindow):
 
         self.base_dat: Optional[Path] = None
         self.work_dir: Optional[Path] = None
+        # Bumped per reload_ui(); stale off-thread tab loads are ignored.
+        self._reload_generation = 0
 
         self._theme_name = DEFAULT_THEME
         self._dark_enabled = True
-        self._build_ui()
+        # Auto-apply state must exist before _build_ui wires the currency signals.
         self._setup_auto_apply()
+        self._build_ui()
         self.apply_named_theme(self._theme_name)
 
 
+    def closeEvent(self, event) -> None:  # noqa: N802
+        # The worker's QThread is a child of this window; destroying it while it
+        # runs aborts the process and leaves a half-written _patched.dat (repack)
+        # or a half-populated work folder (extract).
+        if self._worker_running():
+            what = "repack" if isinstance(getattr(self, "_worker", None), RepackWorker) else "extract"
+            QMessageBox.information(
+                self, "Please wait", f"The {what} is still running. Close the window once it finishes."
+            )
+            event.ignore()
+            return
+        # Persist any label edits still waiting on a deferred flush.
+        try:
+            self.id_db.flush()
+        except Exception:
+            pass
+        # ...and the engine parts DB update coalesced by that tab's timer.
+        try:
+            flush = getattr(getattr(self, "engine_parts_tab", None), "flush_pending_writes", None)
+            if callable(flush):
+                flush()
+        except Exception:
+            pass
+        self._flush_log()
+        super().closeEvent(event)
+
     # ---------------------------
     # Theme
     # ---------------------------
 
 
     def reload_ui(self) -> None:
-        """Refresh tabs after Extract / Load Values."""
+        """Refresh tabs after Extract / Load Values.
+
+        Tabs exposing load_data()/apply_data() scan the workdir on QThreadPool and
+        are applied on the GUI thread as results arrive; the rest refresh inline.
+        """
+        self._reload_generation += 1
+        pool = QThreadPool.globalInstance()
         # Refresh any tabs that support workdir-based loading
         for tab in (
             getattr(self, "garage_unlocks_tab", None),
@@ -108,12 +163,32 @@ class MainWindow(ActionsMixin, BrowserMixin, QMainWindow):
             getattr(self, "unlock_manager_tab", None),
             getattr(self, "stats_tab", None),
         ):
-            if tab is not None and hasattr(tab, "refresh_from_workdir"):
+            if tab is None or not self.work_dir:
+                continue
+            if hasattr(tab, "load_data") and hasattr(tab, "apply_data"):
+                task = TabLoadTask(self._reload_generation, tab, self.work_dir)
+                task.signals.loaded.connect(self._on_tab_data_loaded)
+                task.signals.failed.connect(self._on_tab_data_failed)
+                pool.start(task)
+            elif hasattr(tab, "refresh_from_workdir"):
                 try:
                     tab.refresh_from_workdir(self.work_dir)
                 except Exception:
                     pass
 
+    def _on_tab_data_loaded(self, generation: int, tab: object, data: object) -> None:
+        # Drop results from a reload that has since been superseded.
+        if generation != self._reload_generation:
+            return
+        try:
+            tab.apply_data(data)  # type: ignore[attr-defined]
+        except Exception as e:
+            self._msg(f"[Reload] {type(tab).__name__} refresh failed: {e}")
+
+    def _on_tab_data_failed(self, generation: int, tab: object, error: str) -> None:
+        if generation == self._reload_generation:
+            self._msg(f"[Reload] {type(tab).__name__} refresh failed: {error}")
+
 
     def _setup_auto_apply(self) -> None:
         """Initialize debounced auto-apply (sync to extracted blocks; does not repack)."""
@@ -121,12 +196,24 @@ class MainWindow(ActionsMixin, BrowserMixin, QMainWindow):
         self._auto_apply_timer.setSingleShot(True)
         self._auto_apply_timer.timeout.connect(self._run_auto_apply)
         self._auto_apply_pending = False
+        # Trailing-edge debounce state: the timer is not restarted per keystroke;
+        # instead _run_auto_apply re-arms itself until the input has been quiet
+        # for the requested delay.
+        self._last_edit_ns = 0
+        self._auto_apply_delay_ms = 650
+        # Currency field values as last loaded/applied; edits that return to
+        # this state need no apply pass.
+        self._currency_snapshot: Optional[tuple] = None
         # Domain-specific dirty flags so we don't re-apply heavy operations (unlock/stats)
         # on every small UI edit.
         self._dirty_currency = False
         # Global suspend flag for programmatic UI updates (loading values, refreshing tabs).
         self._suspend_auto_apply = False
 
+    def _on_currency_edited(self, *_args) -> None:
+        """Slot for currency widget edits; drops the signal payload (value/text)."""
+        self._queue_auto_apply(domain="currency")
+
     def _queue_auto_apply(self, delay_ms: int = 650, *, domain: str = "currency") -> None:
         """Queue an auto-apply flush after a short debounce.
 
@@ -134,52 +221,89 @@ class MainWindow(ActionsMixin, BrowserMixin, QMainWindow):
         Heavy domains (garage unlocks / stats) are applied explicitly via their
         "Apply" buttons or via Save/Repack when "Apply pending edits" is enabled.
         """
-        if not hasattr(self, "_auto_apply_timer"):
-            return
-        if getattr(self, "_suspend_auto_apply", False):
+        if self._suspend_auto_apply:
             return
 
         if domain == "currency":
             self._dirty_currency = True
         self._auto_apply_pending = True
+        self._last_edit_ns = time.monotonic_ns()
+        self._auto_apply_delay_ms = delay_ms
         try:
             self.mark_unsynced()
         except Exception:
             pass
-        self._auto_apply_timer.start(delay_ms)
+        timer = self._auto_apply_timer
+        if not timer.isActive() or timer.remainingTime() > delay_ms:
+            timer.start(delay_ms)
+
+    def _on_currency_editing_finished(self) -> None:
+        """Flush a pending currency edit soon after the field loses focus.
+
+        textEdited already queued the apply; this only shortens the wait, so the
+        pair never produces two apply passes (and Enter with no edit does nothing).
+        """
+        if self._auto_apply_pending:
+            self._queue_auto_apply(delay_ms=50, domain="currency")
 
     def _flush_auto_apply(self) -> None:
         """Flush any pending auto-apply immediately (call before Save/Repack)."""
-        if hasattr(self, "_auto_apply_timer") and self._auto_apply_timer.isActive():
+        if self._auto_apply_timer.isActive():
             self._auto_apply_timer.stop()
-        self._run_auto_apply()
+        self._run_auto_apply(force=True)
+
+    def _currency_ui_state(self) -> tuple:
+        return (self.coins_spin.value(), self.rating_edit.text(), self.player_exp_edit.text())
 
-    def _run_auto_apply(self) -> None:
+    def _snapshot_currency(self) -> None:
+        """Record the currency fields as matching the extracted blocks."""
+        self._currency_snapshot = self._currency_ui_state()
+
+    def _discard_auto_apply(self) -> None:
+        """Drop a queued auto-apply (caller applies the same values itself)."""
+        if self._auto_apply_timer.isActive():
+            self._auto_apply_timer.stop()
+        self._auto_apply_pending = False
+        self._dirty_currency = False
+
+    def _run_auto_apply(self, *, force: bool = False) -> None:
         """Apply current UI values into extracted blocks using existing handlers."""
-        if not getattr(self, "_auto_apply_pending", False):
+        if not self._auto_apply_pending:
             return
+
+        if not force:
+            elapsed_ms = (time.monotonic_ns() - self._last_edit_ns) / 1e6
+            remaining = self._auto_apply_delay_ms - elapsed_ms
+            if remaining > 2:
+                self._auto_apply_timer.start(int(remaining))
+                return
+
+        # A background extract/repack owns the blocks folder: keep the edit
+        # pending; _on_worker_thread_done() re-arms the timer when it finishes.
+        if self._worker_running():
+            return
+
         self._auto_apply_pending = False
 
-        if getattr(self, "_suspend_auto_apply", False):
+        if self._suspend_auto_apply:
             return
 
         # Only apply if extracted blocks exist
-        if hasattr(self, "_ensure_extracted"):
-            try:
-                if not self._ensure_extracted():
-                    return
-            except Exception:
+        try:
+            if not self._ensure_extracted():
                 return
+        except Exception:
+            return
 
         # Apply without showing dialogs and without re-loading UI for each step.
         # IMPORTANT: only auto-apply currency to avoid lag/log spam.
-        if getattr(self, "_dirty_currency", False):
-            try:
-                if hasattr(self, "on_apply_currency"):
-                    # type: ignore[arg-type]
+        if self._dirty_currency:
+            if self._currency_ui_state() != self._currency_snapshot:
+                try:
                     self.on_apply_currency(silent=True, reload_ui=False)
-            except Exception:
-                pass
+                    self._snapshot_currency()
+                except Exception:
+                    pass
             self._dirty_currency = False
 
         # NOTE: do not auto-apply other domains here (unlock/stats/slot-limits),
@@ -295,55 +419,108 @@ class MainWindow(ActionsMixin, BrowserMixin, QMainWindow):
         self.stats_tab.applyRequested.connect(self._on_apply_stats_requested)
         try:
             # Do not auto-apply heavy domains on each edit; just mark unsynced.
-            self.stats_tab.changed.connect(lambda: self.mark_unsynced("Stats"))
+            self.stats_tab.changed.connect(partial(self.mark_unsynced, "Stats"))
         except Exception:
             pass
         self.tabs.addTab(self.stats_tab, "Time / Races / Cups / Points")
 
-        self.garage_unlocks_tab = GarageUnlocksTab(
+        # Heavy tabs are built the first time they are opened (see _materialize_tab).
+        self._tab_factories: Dict[QWidget, Tuple[str, str, Callable[[], QWidget]]] = {}
+        self._add_lazy_tab("garage_unlocks_tab", "Garage & Unlocks", self._create_garage_unlocks_tab)
+        self._add_lazy_tab("engine_parts_tab", "Engine Parts", self._create_engine_parts_tab)
+        self._add_lazy_tab("progression_tab", "Car Slots", self._create_progression_tab)
+        self._add_lazy_tab("unlock_manager_tab", "Advanced Unlocks", self._create_unlock_manager_tab)
+
+        self.browser_tab = self._build_browser_tab()
+        self.tabs.addTab(self.browser_tab, "Data Browser")
+
+        self._setup_lazy_refresh()
+
+        root.addWidget(self.tabs)
+
+        # Status bar sync indicator
+        try:
+            self._sync_label = QLabel("Synced")
+            self._sync_label.setObjectName("SyncPill")
+            self._sync_label.setProperty("state", "synced")
+            self.statusBar().addPermanentWidget(self._sync_label)
+        except Exception:
+            self._sync_label = None
+
+        # Toolbar (keyboard shortcuts) - no top menus to save space
+        self._build_actions_bar()
+
+    # ---------------------------
+    # Lazily constructed tabs
+    # ---------------------------
+
+    def _add_lazy_tab(self, attr: str, title: str, factory: Callable[[], QWidget]) -> None:
+        """Reserve a tab slot with an empty placeholder; the real widget is built on first visit."""
+        placeholder = QWidget()
+        self.tabs.addTab(placeholder, title)
+        self._tab_factories[placeholder] = (attr, title, factory)
+
+    def _materialize_tab(self, index: int) -> None:
+        placeholder = self.tabs.widget(index)
+        entry = self._tab_factories.pop(placeholder, None)
+        if entry is None:
+            return
+        attr, title, factory = entry
+        real = factory()
+        setattr(self, attr, real)
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.insertTab(index, real, title)
+            self.tabs.removeTab(index + 1)
+            self.tabs.setCurrentIndex(index)
+        finally:
+            self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        self._lazy_refresh_widgets[real] = attr
+
+    def _create_garage_unlocks_tab(self) -> QWidget:
+        tab = GarageUnlocksTab(
             self,
             id_db=self.id_db,
             observed_db_path=Path(self.data_dir) / "observed_db.json",
         )
-        self.garage_unlocks_tab.applyRequested.connect(
-            lambda payload: self._on_apply_garage_unlocks_requested(payload, reload_ui=True)  # type: ignore[misc]
+        tab.applyRequested.connect(
+            partial(self._on_apply_garage_unlocks_requested, reload_ui=True)  # type: ignore[misc]
         )
         try:
-            self.garage_unlocks_tab.changed.connect(lambda: self.mark_unsynced("Garage"))
+            tab.changed.connect(partial(self.mark_unsynced, "Garage"))
         except Exception:
             pass
-        self.tabs.addTab(self.garage_unlocks_tab, "Garage & Unlocks")
+        return tab
 
+    def _create_engine_parts_tab(self) -> QWidget:
         # Engine Parts tab currently accepts id_db + tune_db; keep call signature aligned.
-        self.engine_parts_tab = EnginePartsTab(
+        tab = EnginePartsTab(
             self,
             id_db=self.id_db,
             tune_db=self.tune_db,
         )
         try:
-            self.engine_parts_tab.changed.connect(lambda: self.mark_unsynced("Engine Parts"))
-        except Exception:
-            pass
-        self.tabs.addTab(self.engine_parts_tab, "Engine Parts")
-        try:
-            pass
+            tab.changed.connect(partial(self.mark_unsynced, "Engine Parts"))
         except Exception:
             pass
+        return tab
 
-
-        self.progression_tab = ProgressionTab(self, id_db=self.id_db)
+    def _create_progression_tab(self) -> QWidget:
+        tab = ProgressionTab(self, id_db=self.id_db)
         try:
-            self.progression_tab.changed.connect(lambda: self.mark_unsynced("Car Slots"))
+            tab.changed.connect(partial(self.mark_unsynced, "Car Slots"))
         except Exception:
             pass
-        self.tabs.addTab(self.progression_tab, "Car Slots")
+        return tab
 
+    def _create_unlock_manager_tab(self) -> QWidget:
         # Advanced (power-user) unlock management
-        self.unlock_manager_tab = UnlockManagerTab(self)
+        tab = UnlockManagerTab(self)
         try:
             # Some builds expose configure(); keep this optional to avoid boot failures.
-            if hasattr(self.unlock_manager_tab, "configure"):
-                self.unlock_manager_tab.configure(
+            if hasattr(tab, "configure"):
+                tab.configure(
                     id_db=self.id_db,
                     extracted_dir=self.work_dir,
                     observed_db_path=Path(self.data_dir) / "observed_db.json",
@@ -351,31 +528,12 @@ class MainWindow(ActionsMixin, BrowserMixin, QMainWindow):
         except Exception:
             pass
         try:
-            self.unlock_manager_tab.applyRequested.connect(
-                lambda payload: self._on_apply_garage_unlocks_requested(payload, reload_ui=True)  # type: ignore[arg-type]
+            tab.applyRequested.connect(
+                partial(self._on_apply_garage_unlocks_requested, reload_ui=True)  # type: ignore[arg-type]
             )
         except Exception:
             pass
-        self.tabs.addTab(self.unlock_manager_tab, "Advanced Unlocks")
-
-        self.browser_tab = self._build_browser_tab()
-        self.tabs.addTab(self.browser_tab, "Data Browser")
-
-        self._setup_lazy_refresh()
-
-        root.addWidget(self.tabs)
-
-        # Status bar sync indicator
-        try:
-            self._sync_label = QLabel("Synced")
-            self._sync_label.setObjectName("SyncPill")
-            self._sync_label.setProperty("state", "synced")
-            self.statusBar().addPermanentWidget(self._sync_label)
-        except Exception:
-            self._sync_label = None
-
-        # Toolbar (keyboard shortcuts) - no top menus to save space
-        self._build_actions_bar()
+        return tab
 
     def _build_header_card(self) -> QWidget:
         card = QFrame()
@@ -471,7 +629,14 @@ class MainWindow(ActionsMixin, BrowserMixin, QMainWindow):
             except Exception:
                 pass
 
-    def _on_main_tab_changed(self, _index: int) -> None:
+    def _on_main_tab_changed(self, index: int) -> None:
+        try:
+            self._materialize_tab(index)
+        except Exception as e:
+            try:
+                self._msg(f"[LazyLoad] building tab failed: {e}")
+            except Exception:
+                pass
         self._refresh_active_lazy_tab()
 
     # ---------------------------
@@ -513,17 +678,17 @@ class MainWindow(ActionsMixin, BrowserMixin, QMainWindow):
         qa = QGroupBox("Quick actions")
         qal = QHBoxLayout(qa)
         qal.setSpacing(10)
-        btn_extract = QPushButton("Extract")
-        btn_extract.setProperty("variant", "primary")
-        btn_extract.clicked.connect(self.on_extract)  # type: ignore[attr-defined]
+        self.btn_extract = QPushButton("Extract")
+        self.btn_extract.setProperty("variant", "primary")
+        self.btn_extract.clicked.connect(self.on_extract)  # type: ignore[attr-defined]
         btn_load = QPushButton("Load values")
         btn_load.clicked.connect(self.on_load_values)  # type: ignore[attr-defined]
-        btn_save = QPushButton("Save → memory.dat")
-        btn_save.setProperty("variant", "primary")
-        btn_save.clicked.connect(self.on_save)  # type: ignore[attr-defined]
-        qal.addWidget(btn_extract)
+        self.btn_save = QPushButton("Save → memory.dat")
+        self.btn_save.setProperty("variant", "primary")
+        self.btn_save.clicked.connect(self.on_save)  # type: ignore[attr-defined]
+        qal.addWidget(self.btn_extract)
         qal.addWidget(btn_load)
-        qal.addWidget(btn_save)
+        qal.addWidget(self.btn_save)
         outer.addWidget(qa)
 
         outer.addStretch(1)
@@ -597,16 +762,19 @@ class MainWindow(ActionsMixin, BrowserMixin, QMainWindow):
             act_open.setShortcut("Ctrl+O")
             act_open.triggered.connect(self.on_open_file)  # type: ignore[attr-defined]
             self.addAction(act_open)
+            self.act_open = act_open
 
             act_extract_load = QAction("Extract + Load Values", self)
             act_extract_load.setShortcut("Ctrl+E")
             act_extract_load.triggered.connect(self.on_extract_and_load)  # type: ignore[attr-defined]
             self.addAction(act_extract_load)
+            self.act_extract_load = act_extract_load
 
             act_save = QAction("Save → memory.dat", self)
             act_save.setShortcut("Ctrl+S")
             act_save.triggered.connect(self.on_save)  # type: ignore[attr-defined]
             self.addAction(act_save)
+            self.act_save = act_save
 
 
             tb = QToolBar("Main", self)
@@ -633,11 +801,11 @@ class MainWindow(ActionsMixin, BrowserMixin, QMainWindow):
         # Debounced auto-apply (currency only). Use textEdited/editingFinished to avoid
         # triggering a full apply on every programmatic setText() or keystroke.
         try:
-            self.coins_spin.valueChanged.connect(lambda _=0: self._queue_auto_apply(domain="currency"))
-            self.rating_edit.textEdited.connect(lambda _="": self._queue_auto_apply(domain="currency"))
-            self.player_exp_edit.textEdited.connect(lambda _="": self._queue_auto_apply(domain="currency"))
-            self.rating_edit.editingFinished.connect(lambda: self._queue_auto_apply(domain="currency", delay_ms=50))
-            self.player_exp_edit.editingFinished.connect(lambda: self._queue_auto_apply(domain="currency", delay_ms=50))
+            self.coins_spin.valueChanged.connect(self._on_currency_edited)
+            self.rating_edit.textEdited.connect(self._on_currency_edited)
+            self.player_exp_edit.textEdited.connect(self._on_currency_edited)
+            self.rating_edit.editingFinished.connect(self._on_currency_editing_finished)
+            self.player_exp_edit.editingFinished.connect(self._on_currency_editing_finished)
         except Exception:
             pass
 
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import List, Optional
 
-from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer
 
 from core.car_scan import CarRow
 from core.id_database import IdDatabase
 
 
-@dataclass
+@dataclass(slots=True)
 class _Row:
     car_id: str
     db_name: str
@@ -19,6 +20,25 @@ class _Row:
     profile_id: Optional[str]
     has_custom_setup: bool
     swap_count: int
+    # Display strings are derived once per row; data() runs on every repaint.
+    owned_str: str = field(init=False)
+    unlocked_str: str = field(init=False)
+    mileage_str: str = field(init=False)
+    profile_str: str = field(init=False)
+    custom_str: str = field(init=False)
+    swap_str: str = field(init=False)
+    # Lowercased "<car_id>\0<db_name>" for the catalog filter proxy; the NUL
+    # separator keeps a single substring test from matching across columns.
+    search_key: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.search_key = f"{self.car_id}\x00{self.db_name}".lower()
+        self.owned_str = "Yes" if self.owned else "No"
+        self.unlocked_str = "Yes" if self.unlocked else "No"
+        self.mileage_str = "" if self.mileage is None else f"{self.mileage:.4f}".rstrip("0").rstrip(".")
+        self.profile_str = "" if self.profile_id is None else str(self.profile_id)
+        self.custom_str = "Yes" if self.has_custom_setup else "No"
+        self.swap_str = str(self.swap_count)
 
 
 class CarCatalogModel(QAbstractTableModel):
@@ -38,19 +58,46 @@ class CarCatalogModel(QAbstractTableModel):
         "Swap keys",
     ]
 
+    # Only column 1 (DB Name) is editable; flags() is hit for every visible cell.
+    _F_DEFAULT = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+    _F_EDIT = _F_DEFAULT | Qt.ItemFlag.ItemIsEditable
+    _COL_FLAGS = (_F_DEFAULT, _F_EDIT) + (_F_DEFAULT,) * 6
+
+    # Per-column display getters (same order as HEADERS).
+    _GETTERS = tuple(
+        attrgetter(name)
+        for name in (
+            "car_id",
+            "db_name",
+            "owned_str",
+            "unlocked_str",
+            "mileage_str",
+            "profile_str",
+            "custom_str",
+            "swap_str",
+        )
+    )
+    _TEXT_ROLES = (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole)
+
     def __init__(self, *, id_db: IdDatabase):
         super().__init__()
         self._id_db = id_db
         self._rows: List[_Row] = []
-
-    def set_rows(self, cars: List[CarRow]) -> None:
-        self.beginResetModel()
+        # Label edits are written to id_database.json at most once per burst.
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(500)
+        self._flush_timer.timeout.connect(self._id_db.flush)
+
+    def _build_rows(self, cars: List[CarRow]) -> List[_Row]:
+        labels = self._id_db.label_cars_bulk({str(c.car_id) for c in cars})
         rows: List[_Row] = []
         for c in cars:
+            cid = str(c.car_id)
             rows.append(
                 _Row(
-                    car_id=str(c.car_id),
-                    db_name=self._id_db.label_car(c.car_id),
+                    car_id=cid,
+                    db_name=labels[cid],
                     owned=bool(c.owned),
                     unlocked=bool(c.unlocked),
                     mileage=c.mileage,
@@ -59,9 +106,67 @@ class CarCatalogModel(QAbstractTableModel):
                     swap_count=int(c.swap_count or 0),
                 )
             )
-        self._rows = rows
+        return rows
+
+    def set_rows(self, cars: List[CarRow]) -> None:
+        """Replace all rows (full model reset). Use for the initial population."""
+        self.beginResetModel()
+        self._rows = self._build_rows(cars)
         self.endResetModel()
 
+    def update_rows(self, cars: List[CarRow]) -> None:
+        """Diff `cars` against the current rows by car_id and emit minimal signals.
+
+        Removed cars -> beginRemoveRows, new cars -> beginInsertRows, changed
+        cars -> dataChanged. Falls back to set_rows() when the relative order of
+        surviving cars changed or IDs are not unique.
+        """
+        new_rows = self._build_rows(cars)
+        new_ids = [r.car_id for r in new_rows]
+        old_ids = [r.car_id for r in self._rows]
+        new_set = set(new_ids)
+        old_set = set(old_ids)
+        if len(new_set) != len(new_ids) or len(old_set) != len(old_ids):
+            self.set_rows(cars)
+            return
+        kept = [cid for cid in old_ids if cid in new_set]
+        if kept != [cid for cid in new_ids if cid in old_set]:
+            self.set_rows(cars)
+            return
+
+        # Remove vanished rows bottom-up, one contiguous run at a time.
+        i = len(self._rows) - 1
+        while i >= 0:
+            if self._rows[i].car_id in new_set:
+                i -= 1
+                continue
+            end = i
+            while i >= 0 and self._rows[i].car_id not in new_set:
+                i -= 1
+            self.beginRemoveRows(QModelIndex(), i + 1, end)
+            del self._rows[i + 1 : end + 1]
+            self.endRemoveRows()
+
+        # Insert new rows and collect changed ones.
+        changed: List[int] = []
+        for pos, row in enumerate(new_rows):
+            if row.car_id not in old_set:
+                self.beginInsertRows(QModelIndex(), pos, pos)
+                self._rows.insert(pos, row)
+                self.endInsertRows()
+            elif self._rows[pos] != row:
+                self._rows[pos] = row
+                changed.append(pos)
+
+        last_col = len(self.HEADERS) - 1
+        start = 0
+        while start < len(changed):
+            end = start
+            while end + 1 < len(changed) and changed[end + 1] == changed[end] + 1:
+                end += 1
+            self.dataChanged.emit(self.index(changed[start], 0), self.index(changed[end], last_col))
+            start = end + 1
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
         return 0 if parent.isValid() else len(self._rows)
 
@@ -77,40 +182,17 @@ class CarCatalogModel(QAbstractTableModel):
         return None
 
     def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):  # noqa: N802
-        if not index.isValid():
+        if role not in self._TEXT_ROLES or not index.isValid():
             return None
         r = index.row()
-        c = index.column()
         if r < 0 or r >= len(self._rows):
             return None
-        row = self._rows[r]
-
-        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
-            if c == 0:
-                return row.car_id
-            if c == 1:
-                return row.db_name
-            if c == 2:
-                return "Yes" if row.owned else "No"
-            if c == 3:
-                return "Yes" if row.unlocked else "No"
-            if c == 4:
-                return "" if row.mileage is None else f"{row.mileage:.4f}".rstrip("0").rstrip(".")
-            if c == 5:
-                return "" if row.profile_id is None else str(row.profile_id)
-            if c == 6:
-                return "Yes" if row.has_custom_setup else "No"
-            if c == 7:
-                return str(row.swap_count)
-        return None
+        return self._GETTERS[index.column()](self._rows[r])
 
     def flags(self, index: QModelIndex) -> Qt.ItemFlag:  # noqa: N802
         if not index.isValid():
             return Qt.ItemFlag.NoItemFlags
-        f = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
-        if index.column() == 1:
-            f |= Qt.ItemFlag.ItemIsEditable
-        return f
+        return self._COL_FLAGS[index.column()]
 
     def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole):  # noqa: N802
         if role != Qt.ItemDataRole.EditRole or not index.isValid():
@@ -129,14 +211,20 @@ class CarCatalogModel(QAbstractTableModel):
 
         row = self._rows[r]
         row.db_name = name
+        row.search_key = f"{row.car_id}\x00{name}".lower()
         try:
-            self._id_db.set_car_label(row.car_id, name)
+            self._id_db.set_car_label_deferred(row.car_id, name)
+            self._flush_timer.start()
         except Exception:
             pass
 
         self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
         return True
 
+    def haystack(self, row: int) -> str:
+        """Lowercased car_id/db_name search text for `row` (see _Row.search_key)."""
+        return self._rows[row].search_key
+
     def car_id_for_row(self, row: int) -> Optional[str]:
         if 0 <= row < len(self._rows):
             return self._rows[row].car_id
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt
+
+
+class CustomsListModel(QAbstractListModel):
+    """List model over CustomsTab entries (anything with car_id/caption/display/hay).
+
+    The entries stay a plain Python list; the view only asks for visible rows.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries: List[Any] = []
+
+    def set_entries(self, entries: List[Any]) -> None:
+        self.beginResetModel()
+        self._entries = list(entries)
+        self.endResetModel()
+
+    def entry(self, row: int) -> Any:
+        if 0 <= row < len(self._entries):
+            return self._entries[row]
+        return None
+
+    def entry_changed(self, entry: Any) -> None:
+        """Repaint the row holding `entry` after its caption was edited in place."""
+        for row, e in enumerate(self._entries):
+            if e is entry:
+                idx = self.index(row, 0)
+                self.dataChanged.emit(idx, idx, [Qt.ItemDataRole.DisplayRole])
+                return
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        if parent.isValid():
+            return 0
+        return len(self._entries)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = index.row()
+        if row >= len(self._entries):
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._entries[row].display
+        if role == Qt.ItemDataRole.UserRole:
+            return self._entries[row]
+        return None
+
+
+class CustomsFilterProxyModel(QSortFilterProxyModel):
+    """Case-insensitive substring filter on each entry's precomputed `hay`."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._q = ""
+        # Python-side handle to the source model; avoids a C++ call per filtered row.
+        self._src: Optional[CustomsListModel] = None
+
+    def setSourceModel(self, model) -> None:  # noqa: N802
+        super().setSourceModel(model)
+        self._src = model if isinstance(model, CustomsListModel) else None
+
+    def set_query(self, q: str) -> None:
+        self._q = (q or "").strip().lower()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:  # noqa: N802
+        if not self._q:
+            return True
+        m = self._src
+        e = m.entry(source_row) if m is not None else None
+        if e is None:
+            return True
+        return self._q in e.hay
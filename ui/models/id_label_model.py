@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+def id_sort_key(s: str) -> Tuple[int, Any]:
+    """Numeric ids first (by value), then anything else by text; no try/except."""
+    digits = s[1:] if s[:1] == "-" else s
+    if digits.isdecimal():
+        return (0, int(s))
+    return (1, s)
+
+
+class IdLabelTableModel(QAbstractTableModel):
+    """Read-only (ID, Name, ...) table for the Database tab's lists.
+
+    Rows are plain tuples with one entry per header; the view only asks for the
+    visible ones. The ID column sorts numerically (see id_sort_key), the others
+    by displayed text; the sort is re-applied to each new row set so the
+    header's sort indicator stays meaningful.
+    """
+
+    HEADERS = ("ID", "Name")
+
+    def __init__(self, parent=None, headers: Sequence[str] = HEADERS):
+        super().__init__(parent)
+        self._headers = tuple(headers)
+        self._rows: List[Tuple[str, ...]] = []
+        self._sort: Optional[Tuple[int, Qt.SortOrder]] = None
+
+    def set_rows(self, rows: List[Tuple[str, ...]]) -> None:
+        self.beginResetModel()
+        self._rows = list(rows)
+        if self._sort is not None:
+            self._sort_rows(*self._sort)
+        self.endResetModel()
+
+    def rows(self) -> List[Tuple[str, ...]]:
+        return self._rows
+
+    def row_id(self, row: int) -> Optional[str]:
+        if 0 <= row < len(self._rows):
+            return self._rows[row][0]
+        return None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):  # noqa: N802
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < len(self._headers):
+                return self._headers[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        # Only DisplayRole is answered; every other role falls through to Qt defaults.
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        r = index.row()
+        if r >= len(self._rows):
+            return None
+        return self._rows[r][index.column()]
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        if not 0 <= column < len(self._headers):
+            return
+        self._sort = (column, order)
+        self.layoutAboutToBeChanged.emit()
+        self._sort_rows(column, order)
+        self.layoutChanged.emit()
+
+    def _sort_rows(self, column: int, order: Qt.SortOrder) -> None:
+        if column == 0:
+            key = lambda r: id_sort_key(r[0])  # noqa: E731
+        else:
+            key = lambda r: r[column]  # noqa: E731
+        self._rows.sort(key=key, reverse=order == Qt.SortOrder.DescendingOrder)
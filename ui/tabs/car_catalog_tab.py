@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import csv
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
-from PyQt6.QtCore import Qt, QRegularExpression
+from PyQt6.QtCore import Qt, QRegularExpression, QTimer
 from PyQt6.QtGui import QGuiApplication, QAction
 from PyQt6.QtWidgets import (
     QWidget,
@@ -43,8 +43,14 @@ class _MultiColumnFilterProxyModel:
             def __init__(self, parent=None):
                 super().__init__(parent)
                 self._q = ""
+                # Python-side handle to the source model; avoids a C++ call per filtered row.
+                self._src = None
                 self.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
 
+            def setSourceModel(self, model) -> None:  # noqa: N802
+                super().setSourceModel(model)
+                self._src = model
+
             def set_query(self, q: str) -> None:
                 self._q = (q or "").strip().lower()
                 self.invalidateFilter()
@@ -52,16 +58,11 @@ class _MultiColumnFilterProxyModel:
             def filterAcceptsRow(self, source_row: int, source_parent):  # noqa: N802
                 if not self._q:
                     return True
-                m = self.sourceModel()
+                m = self._src
                 if m is None:
                     return True
-                # Column 0 = Car ID, Column 1 = DB Name
-                for col in (0, 1):
-                    idx = m.index(source_row, col, source_parent)
-                    s = str(m.data(idx, Qt.ItemDataRole.DisplayRole) or "").lower()
-                    if self._q in s:
-                        return True
-                return False
+                # Car ID / DB Name, lowercased once per row by the model.
+                return self._q in m.haystack(source_row)
 
         self._proxy = _Proxy()
 
@@ -93,7 +94,18 @@ class CarCatalogTab(QWidget):
     def refresh_from_workdir(self, work_dir: Path) -> None:
         self._work_dir = work_dir
         cars = scan_cars_from_workdir(work_dir)
-        self._model.set_rows(cars)
+        # Sort once after the bulk update instead of as each row lands in the proxy.
+        self.tbl.setSortingEnabled(False)
+        self._proxy.setDynamicSortFilter(False)
+        try:
+            if self._model.rowCount():
+                self._model.update_rows(cars)
+            else:
+                self._model.set_rows(cars)
+        finally:
+            self._proxy.setDynamicSortFilter(True)
+            # Re-enabling sorts by the current header indicator.
+            self.tbl.setSortingEnabled(True)
         self.lbl_counts.setText(f"Cars discovered: {len(cars)}")
 
     # ------------------ UI ------------------
@@ -106,7 +118,12 @@ class CarCatalogTab(QWidget):
         toolbar = QHBoxLayout()
         self.ed_search = QLineEdit()
         self.ed_search.setPlaceholderText("Search (Car ID or DB Name)")
-        self.ed_search.textChanged.connect(lambda s: self._proxy_wrap.proxy().set_query(s))
+        # Refilter once typing pauses rather than on every keystroke.
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(lambda: self._proxy.set_query(self.ed_search.text()))
+        self.ed_search.textChanged.connect(self._on_filter_edited)
         toolbar.addWidget(self.ed_search, 2)
 
         self.btn_export = QPushButton("Export CSV")
@@ -132,6 +149,8 @@ class CarCatalogTab(QWidget):
         self.tbl.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.tbl.customContextMenuRequested.connect(self._open_menu)
         self.tbl.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        # ResizeToContents measures every row by default; sample a bounded number instead.
+        self.tbl.horizontalHeader().setResizeContentsPrecision(64)
         self.tbl.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         root.addWidget(self.tbl, 1)
 
@@ -147,6 +166,10 @@ class CarCatalogTab(QWidget):
         hint.setObjectName("hint")
         root.addWidget(hint)
 
+    def _on_filter_edited(self, *_args) -> None:
+        """Slot for filter edits; drops the text and restarts the debounce timer."""
+        self._filter_timer.start()
+
     # ------------------ Context menu ------------------
 
     def _open_menu(self, pos) -> None:
@@ -165,28 +188,22 @@ class CarCatalogTab(QWidget):
 
         menu.exec(self.tbl.viewport().mapToGlobal(pos))
 
+    def _selected_car_ids(self) -> List[str]:
+        car_id_for_row = self._model.car_id_for_row
+        map_to_source = self._proxy.mapToSource
+        rows = [map_to_source(i).row() for i in self.tbl.selectionModel().selectedRows()]
+        return [cid for r in rows if (cid := car_id_for_row(r))]
+
     def _copy_selected_ids(self) -> None:
-        idxs = self.tbl.selectionModel().selectedRows()
-        ids = []
-        for i in idxs:
-            src = self._proxy.mapToSource(i)
-            cid = self._model.car_id_for_row(src.row())
-            if cid:
-                ids.append(cid)
+        ids = self._selected_car_ids()
         if ids:
             QGuiApplication.clipboard().setText("\n".join(ids))
 
     def _copy_selected_names(self) -> None:
-        idxs = self.tbl.selectionModel().selectedRows()
-        names = []
-        for i in idxs:
-            src = self._proxy.mapToSource(i)
-            cid = self._model.car_id_for_row(src.row())
-            if not cid:
-                continue
-            names.append(self._id_db.label_car(cid))
-        if names:
-            QGuiApplication.clipboard().setText("\n".join(names))
+        ids = self._selected_car_ids()
+        if ids:
+            labels = self._id_db.label_cars_bulk(ids)
+            QGuiApplication.clipboard().setText("\n".join([labels[cid] for cid in ids]))
 
     # ------------------ CSV Import/Export ------------------
 
@@ -198,11 +215,11 @@ class CarCatalogTab(QWidget):
             return
         try:
             with open(path, "w", newline="", encoding="utf-8") as f:
+                ids = [self._model.car_id_for_row(r) or "" for r in range(self._model.rowCount())]
+                labels = self._id_db.label_cars_bulk(ids)
                 w = csv.writer(f)
                 w.writerow(["car_id", "db_name"])
-                for r in range(self._model.rowCount()):
-                    cid = self._model.car_id_for_row(r) or ""
-                    w.writerow([cid, self._id_db.label_car(cid)])
+                w.writerows((cid, labels[cid]) for cid in ids)
         except Exception as e:
             QMessageBox.warning(self, "Export failed", str(e))
 
@@ -212,15 +229,27 @@ class CarCatalogTab(QWidget):
             return
         try:
             changed = 0
+            updates: Dict[str, str] = {}
             with open(path, "r", newline="", encoding="utf-8") as f:
-                r = csv.DictReader(f)
-                for row in r:
-                    cid = str(row.get("car_id") or "").strip()
-                    name = str(row.get("db_name") or "").strip()
-                    if not cid or not cid.isdigit() or not name:
-                        continue
-                    self._id_db.set_car_label(cid, name)
-                    changed += 1
+                r = csv.reader(f)
+                header = next(r, None) or []
+                try:
+                    i_cid = header.index("car_id")
+                    i_name = header.index("db_name")
+                except ValueError:
+                    i_cid = i_name = -1
+                if i_cid >= 0:
+                    width = max(i_cid, i_name) + 1
+                    for row in r:
+                        if len(row) < width:
+                            continue
+                        cid = row[i_cid].strip()
+                        name = row[i_name].strip()
+                        if not cid or not cid.isdigit() or not name:
+                            continue
+                        updates[cid] = name
+                        changed += 1
+            self._id_db.set_car_labels_bulk(updates)
             if self._work_dir:
                 self.refresh_from_workdir(self._work_dir)
             QMessageBox.information(self, "Import complete", f"Updated {changed} car name(s).")
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QModelIndex, QSignalBlocker, Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -12,28 +15,37 @@ from PyQt6.QtWidgets import (
     QLabel,
     QPushButton,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QSplitter,
     QGroupBox,
     QFormLayout,
     QMessageBox,
 )
 
-from core.json_ops import read_text_any, try_load_json, load_json_file_cached, dump_json_compact, write_text_utf16le, set_first_keys
+from core.json_ops import read_text_any, load_json_file_cached, write_json_utf16le, set_first_keys
+from ui.models.customs_list_model import CustomsFilterProxyModel, CustomsListModel
 
 
-def _deep_find(obj: Any, key: str):
+def _deep_find_many(obj: Any, keys: Iterable[str]) -> Dict[str, Any]:
+    """Depth-first search (LIFO stack) for several keys in one walk.
+
+    Visit order matches a single-key stack search, so each key resolves to
+    the same occurrence it would when searched on its own.
+    """
+    remaining = set(keys)
+    out: Dict[str, Any] = {}
     stack = [obj]
-    while stack:
+    while stack and remaining:
         cur = stack.pop()
-        if isinstance(cur, dict):
-            if key in cur:
-                return cur[key]
+        t = type(cur)
+        if t is dict:
+            for k in [k for k in remaining if k in cur]:
+                out[k] = cur[k]
+                remaining.discard(k)
             stack.extend(cur.values())
-        elif isinstance(cur, list):
+        elif t is list:
             stack.extend(cur)
-    return None
+    return out
 
 
 @dataclass
@@ -41,6 +53,29 @@ class CustomCarEntry:
     path: Path
     car_id: str
     caption: str
+    # Block mtime when it was scanned (or last written by apply_caption). The
+    # parsed block itself is not kept: it would pin every block, including
+    # ones too large for the json_ops cache, for the life of the tab.
+    mtime_ns: int = field(default=0, repr=False, compare=False)
+    # Lowercased "carId caption" used by the list filter.
+    hay: str = field(init=False, repr=False, compare=False)
+    # Numeric car id first, then caption; parsed once instead of per comparison.
+    sort_key: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._derive()
+
+    def set_caption(self, caption: str) -> None:
+        self.caption = caption
+        self._derive()
+
+    def _derive(self) -> None:
+        self.hay = f"{self.car_id} {self.caption}".lower()
+        cap_lower = self.caption.lower()
+        try:
+            self.sort_key = (0, int(self.car_id), cap_lower)
+        except ValueError:
+            self.sort_key = (1, self.car_id, cap_lower)
 
     @property
     def display(self) -> str:
@@ -48,6 +83,48 @@ class CustomCarEntry:
         return f"{self.car_id} - {cap}" if cap else f"{self.car_id} - <no caption>"
 
 
+def _scan_block(p: Path) -> Optional[CustomCarEntry]:
+    """Return the caption entry stored in block `p`, or None (thread-safe, no widgets)."""
+    try:
+        mtime_ns = p.stat().st_mtime_ns
+        # Most blocks carry no caption at all; a substring test on the (cached)
+        # decoded text is far cheaper than building the object tree to find out.
+        if '"caption"' not in read_text_any(p):
+            return None
+        o = load_json_file_cached(p)
+    except Exception:
+        return None
+
+    found = _deep_find_many(o, ("caption", "carId"))
+    cap = found.get("caption")
+    if cap is None:
+        return None
+
+    car_id = found.get("carId")
+    if car_id is None:
+        # Some blocks may not include carId; still show, but keep stable.
+        car_id_s = "?"
+    else:
+        car_id_s = str(car_id)
+    return CustomCarEntry(path=p, car_id=car_id_s, caption=str(cap), mtime_ns=mtime_ns)
+
+
+def _scan_blocks_dir(blocks_dir: Path) -> List[CustomCarEntry]:
+    """Scan every block in parallel; file reads release the GIL."""
+    with os.scandir(blocks_dir) as it:
+        names = [d.path for d in it if d.is_file()]
+    if not names:
+        return []
+    names.sort()
+    paths = [Path(n) for n in names]
+    with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 4)) as ex:
+        entries = [e for e in ex.map(_scan_block, paths) if e is not None]
+
+    # Stable sorting by numeric car id, then caption
+    entries.sort(key=attrgetter("sort_key"))
+    return entries
+
+
 class CustomsTab(QWidget):
     """Browse/edit custom car captions.
 
@@ -61,7 +138,6 @@ class CustomsTab(QWidget):
         super().__init__(parent)
         self.extracted_dir: Optional[Path] = None
         self._entries: list[CustomCarEntry] = []
-        self._loading = False
 
         root = QVBoxLayout(self)
 
@@ -83,11 +159,20 @@ class CustomsTab(QWidget):
         ll = QVBoxLayout(left)
         self.filter_edit = QLineEdit()
         self.filter_edit.setPlaceholderText("Filter (carId or caption)…")
-        self.filter_edit.textChanged.connect(self._refilter)
+        # Refilter once typing pauses rather than on every keystroke.
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._refilter)
+        self.filter_edit.textChanged.connect(self._on_filter_edited)
         ll.addWidget(self.filter_edit)
 
-        self.list = QListWidget()
-        self.list.currentItemChanged.connect(self._on_selected)
+        self._model = CustomsListModel(self)
+        self._proxy = CustomsFilterProxyModel(self)
+        self._proxy.setSourceModel(self._model)
+        self.list = QListView()
+        self.list.setModel(self._proxy)
+        self.list.selectionModel().currentChanged.connect(self._on_selected)
         ll.addWidget(self.list, 1)
         self.split.addWidget(left)
 
@@ -137,107 +222,82 @@ class CustomsTab(QWidget):
         self.set_context(work_dir)
         self.refresh()
 
+    def load_data(self, work_dir: Path) -> tuple[Path, Optional[List[CustomCarEntry]]]:
+        """Scan `work_dir` without touching widgets (may run on a worker thread)."""
+        blocks_dir = Path(work_dir) / "blocks"
+        if not blocks_dir.exists():
+            return work_dir, None
+        return work_dir, _scan_blocks_dir(blocks_dir)
+
+    def apply_data(self, data: tuple[Path, Optional[List[CustomCarEntry]]]) -> None:
+        """GUI-thread half of refresh_from_workdir()."""
+        work_dir, entries = data
+        self.set_context(work_dir)
+        self._reset_view()
+        if entries is not None:
+            self._show_entries(entries)
+
     # ---------------------------
     # Data
     # ---------------------------
 
     def refresh(self) -> None:
-        self._entries.clear()
-        self.list.clear()
-        self.lbl_src.setText("")
-        self._loading = True
-        try:
-            self.caption_edit.setText("")
-            self.lbl_block.setText("")
-            self.lbl_car_id.setText("")
-        finally:
-            self._loading = False
-
+        self._reset_view()
         if self.extracted_dir is None:
             return
         blocks_dir = self.extracted_dir / "blocks"
         if not blocks_dir.exists():
             return
+        self._show_entries(_scan_blocks_dir(blocks_dir))
 
-        found = 0
-        for p in sorted(blocks_dir.glob("*")):
-            try:
-                o = load_json_file_cached(p)
-            except Exception:
-                continue
-
-            cap = _deep_find(o, "caption")
-            if cap is None:
-                continue
-
-            car_id = _deep_find(o, "carId")
-            if car_id is None:
-                # Some blocks may not include carId; still show, but keep stable.
-                car_id_s = "?"
-            else:
-                car_id_s = str(car_id)
-
-            entry = CustomCarEntry(path=p, car_id=car_id_s, caption=str(cap))
-            self._entries.append(entry)
-            found += 1
-
-        # Stable sorting by numeric car id, then caption
-        def _sort_key(e: CustomCarEntry):
-            try:
-                return (0, int(e.car_id), e.caption.lower())
-            except Exception:
-                return (1, e.car_id, e.caption.lower())
-
-        self._entries.sort(key=_sort_key)
-        self.lbl_src.setText(f"Found {found} caption block(s)")
+    def _reset_view(self) -> None:
+        self._entries.clear()
+        self._model.set_entries([])
+        self.lbl_src.setText("")
+        with QSignalBlocker(self.caption_edit):
+            self.caption_edit.setText("")
+        self.lbl_block.setText("")
+        self.lbl_car_id.setText("")
+
+    def _show_entries(self, entries: List[CustomCarEntry]) -> None:
+        self._entries = entries
+        self._model.set_entries(entries)
+        self.lbl_src.setText(f"Found {len(entries)} caption block(s)")
         self._refilter()
 
+    def _on_filter_edited(self, *_args) -> None:
+        """Slot for filter edits; drops the text and restarts the debounce timer."""
+        self._filter_timer.start()
+
     def _refilter(self) -> None:
-        q = (self.filter_edit.text() or "").strip().lower()
-        self.list.blockSignals(True)
-        try:
-            self.list.clear()
-            for e in self._entries:
-                hay = f"{e.car_id} {e.caption}".lower()
-                if q and q not in hay:
-                    continue
-                it = QListWidgetItem(e.display)
-                it.setData(Qt.ItemDataRole.UserRole, e)
-                self.list.addItem(it)
-        finally:
-            self.list.blockSignals(False)
+        self._proxy.set_query(self.filter_edit.text())
 
         # Keep selection reasonable
-        if self.list.count() > 0 and self.list.currentRow() < 0:
-            self.list.setCurrentRow(0)
+        if self._proxy.rowCount() > 0 and not self.list.currentIndex().isValid():
+            self.list.setCurrentIndex(self._proxy.index(0, 0))
 
     def _current_entry(self) -> Optional[CustomCarEntry]:
-        it = self.list.currentItem()
-        if it is None:
+        idx = self.list.currentIndex()
+        if not idx.isValid():
             return None
-        e = it.data(Qt.ItemDataRole.UserRole)
+        e = idx.data(Qt.ItemDataRole.UserRole)
         return e if isinstance(e, CustomCarEntry) else None
 
     # ---------------------------
     # UI handlers
     # ---------------------------
 
-    def _on_selected(self, cur: QListWidgetItem, prev: QListWidgetItem) -> None:  # type: ignore[override]
+    def _on_selected(self, cur: QModelIndex, prev: QModelIndex) -> None:
         _ = prev
-        e = cur.data(Qt.ItemDataRole.UserRole) if cur is not None else None
+        e = cur.data(Qt.ItemDataRole.UserRole) if cur.isValid() else None
         if not isinstance(e, CustomCarEntry):
             return
-        self._loading = True
-        try:
-            self.lbl_block.setText(e.path.name)
-            self.lbl_car_id.setText(e.car_id)
+        self.lbl_block.setText(e.path.name)
+        self.lbl_car_id.setText(e.car_id)
+        with QSignalBlocker(self.caption_edit):
             self.caption_edit.setText(e.caption)
-        finally:
-            self._loading = False
 
     def _on_caption_edited(self, _text: str) -> None:
-        if self._loading:
-            return
         self.changed.emit()
 
     def apply_caption(self) -> None:
@@ -249,6 +309,7 @@ class CustomsTab(QWidget):
 
         new_caption = (self.caption_edit.text() or "").strip()
         try:
+            # Cache hit for blocks within the json_ops size limit; copied for mutation.
             obj = load_json_file_cached(e.path, copy_obj=True)
         except Exception as ex:
             QMessageBox.critical(self, "Read failed", str(ex))
@@ -259,16 +320,18 @@ class CustomsTab(QWidget):
             if n <= 0:
                 QMessageBox.warning(self, "Not applied", "Could not find a caption field to update in this block.")
                 return
-            write_text_utf16le(e.path, dump_json_compact(obj))
+            write_json_utf16le(e.path, obj)
         except Exception as ex:
             QMessageBox.critical(self, "Apply failed", str(ex))
             return
 
         # Update cached entry + list label
-        e.caption = new_caption
-        it = self.list.currentItem()
-        if it is not None:
-            it.setText(e.display)
+        try:
+            e.mtime_ns = e.path.stat().st_mtime_ns
+        except Exception:
+            pass
+        e.set_caption(new_caption)
+        self._model.entry_changed(e)
 
         # Mark main window unsynced if available (pending repack)
         try:
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QSignalBlocker, Qt, QTimer
 from PyQt6.QtGui import QGuiApplication
 from PyQt6.QtWidgets import (
     QWidget,
@@ -16,8 +17,7 @@ from PyQt6.QtWidgets import (
     QGroupBox,
     QTabWidget,
     QFormLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QAbstractItemView,
     QMessageBox,
@@ -25,14 +25,53 @@ from PyQt6.QtWidgets import (
 
 from core.id_database import IdDatabase
 from core.favorites_db import FavoritesDb
-from core.json_ops import try_load_json
+from core.json_ops import try_load_json_bytes
+from ui.models.id_label_model import IdLabelTableModel, id_sort_key
 
 
-def _safe_int(s: str) -> int:
+# Raw-byte markers for the keys _load_from_blocks() reads. Blocks are normally
+# UTF-16LE, but UTF-8 files are accepted too, so look for both encodings.
+_BLOCK_KEY_NEEDLES = tuple(
+    f'"{k}"'.encode(enc)
+    for k in ("carId", "lastCarId", "availableTracks")
+    for enc in ("utf-16-le", "utf-8")
+)
+
+
+# Rows shown while the search box holds a single character.
+_SHORT_FILTER_MAX_ROWS = 500
+
+
+def _load_candidate_block(p: Path) -> Optional[dict]:
+    """Parse block `p` if its bytes mention one of our keys (thread-safe, no widgets)."""
+    try:
+        data = p.read_bytes()
+    except OSError:
+        return None
+    # Fast heuristic: only parse blocks that contain our keys
+    if not any(n in data for n in _BLOCK_KEY_NEEDLES):
+        return None
     try:
-        return int(s)
+        obj = try_load_json_bytes(data)
     except Exception:
-        return 10**18
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
+def _indexed_rows(
+    index: Dict[str, Tuple[str, str]], extra_ids: Iterable[str]
+) -> List[Tuple[str, Tuple[str, str]]]:
+    """(search key, (id, name)) for every id in `index` plus `extra_ids`, sorted by id."""
+    ids = set(index)
+    ids.update(extra_ids)
+    out: List[Tuple[str, Tuple[str, str]]] = []
+    for i in sorted(ids, key=id_sort_key):
+        hit = index.get(i)
+        if hit is None:
+            out.append((i.lower(), (i, "")))
+        else:
+            out.append((hit[1], (i, hit[0])))
+    return out
 
 
 class DatabaseTab(QWidget):
@@ -64,7 +103,24 @@ class DatabaseTab(QWidget):
         # current selection (for edit boxes)
         self._sel_car_id: Optional[str] = None  # selected row in Cars DB list
         self._sel_track_id: Optional[str] = None
-
+        # blocks dir -> ((file count, newest mtime_ns), active id, last id, in-game tracks)
+        self._blocks_cache: Dict[Path, Tuple[Tuple[int, int], Optional[str], Optional[str], List[str]]] = {}
+        # kind -> (source state, filter text, matching rows); see _filter_rows().
+        self._filter_cache: Dict[str, Tuple[Any, str, List[Tuple[str, Tuple[str, str]]]]] = {}
+        # kind -> (source state, every (search key, row) sorted by id); reused until the state changes.
+        self._all_rows_cache: Dict[str, Tuple[Any, List[Tuple[str, Tuple[str, str]]]]] = {}
+
+        self._notify_timer = QTimer(self)
+        self._notify_timer.setSingleShot(True)
+        self._notify_timer.setInterval(50)
+        self._notify_timer.timeout.connect(self._do_notify_labels_changed)
+
+        # Set once _build_ui() has created the Cars page widgets; cheaper than hasattr() probes.
+        self._ui_ready = False
+        # The Tracks page is built on first visit (see _ensure_tracks_page_built).
+        self._tracks_ready = False
+        # refresh_from_workdir() ran while hidden; showEvent() catches up.
+        self._reload_pending = False
         self._build_ui()
         self._reload_all()
 
@@ -73,8 +129,22 @@ class DatabaseTab(QWidget):
     def refresh_from_workdir(self, work_dir: Path) -> None:
         self._work_dir = work_dir
         self._load_from_blocks()
+        if not self.isVisible():
+            self._reload_pending = True
+            return
         self._reload_all()
 
+    # -------------------- Qt events --------------------
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        if self._reload_pending:
+            self._reload_pending = False
+            try:
+                self._reload_all()
+            except Exception:
+                pass
+        super().showEvent(event)
+
     # -------------------- UI --------------------
 
     def _build_ui(self) -> None:
@@ -84,8 +154,28 @@ class DatabaseTab(QWidget):
 
         self.subtabs = QTabWidget()
         self.subtabs.addTab(self._build_cars_page(), "Cars")
-        self.subtabs.addTab(self._build_tracks_page(), "Tracks")
+        # Placeholder until the Tracks sub-tab is first opened.
+        self.subtabs.addTab(QWidget(), "Tracks")
+        self.subtabs.currentChanged.connect(self._ensure_tracks_page_built)
         root.addWidget(self.subtabs)
+        self._ui_ready = True
+
+    def _ensure_tracks_page_built(self, index: int) -> None:
+        if self._tracks_ready or index != 1:
+            return
+        placeholder = self.subtabs.widget(1)
+        self.subtabs.blockSignals(True)
+        try:
+            self.subtabs.insertTab(1, self._build_tracks_page(), "Tracks")
+            self.subtabs.removeTab(2)
+            self.subtabs.setCurrentIndex(1)
+        finally:
+            self.subtabs.blockSignals(False)
+        if placeholder is not None:
+            placeholder.deleteLater()
+        self._tracks_ready = True
+        self._reload_ingame_track_table()
+        self._reload_track_db_table()
 
     # ---------- Cars page ----------
 
@@ -145,20 +235,18 @@ class DatabaseTab(QWidget):
         search_row = QHBoxLayout()
         search_row.addWidget(QLabel("Search:"))
         self.ed_car_search = QLineEdit()
-        self.ed_car_search.setPlaceholderText("Filter by ID or name…")
-        self.ed_car_search.textChanged.connect(self._reload_car_db_table)
+        self.ed_car_search.setPlaceholderText("Filter by ID or name (2+ characters)…")
+        self._car_filter_timer = self._make_filter_timer(self._reload_car_db_table)
+        self.ed_car_search.textChanged.connect(lambda _="": self._car_filter_timer.start())
+        # Enter applies the filter immediately.
+        self.ed_car_search.returnPressed.connect(self._car_filter_timer.stop)
+        self.ed_car_search.returnPressed.connect(self._reload_car_db_table)
         search_row.addWidget(self.ed_car_search, 1)
         vb2.addLayout(search_row)
 
-        self.tbl_car_db = QTableWidget(0, 2)
-        self.tbl_car_db.setHorizontalHeaderLabels(["ID", "Name"])
-        self.tbl_car_db.verticalHeader().setVisible(False)
-        self.tbl_car_db.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.tbl_car_db.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-        self.tbl_car_db.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.tbl_car_db.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        self.tbl_car_db.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.tbl_car_db.itemSelectionChanged.connect(self._on_car_db_selected)
+        self._car_db_model = IdLabelTableModel(self)
+        self.tbl_car_db = self._make_id_label_view(self._car_db_model)
+        self.tbl_car_db.selectionModel().selectionChanged.connect(self._on_car_db_selected)
         vb2.addWidget(self.tbl_car_db)
 
         edit_row = QHBoxLayout()
@@ -193,6 +281,30 @@ class DatabaseTab(QWidget):
 
         return page
 
+    def _make_filter_timer(self, slot) -> QTimer:
+        """Single-shot timer that runs `slot` once typing in a search box pauses."""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(200)
+        timer.timeout.connect(slot)
+        return timer
+
+    @staticmethod
+    def _make_id_label_view(model: IdLabelTableModel) -> QTableView:
+        tbl = QTableView()
+        tbl.setModel(model)
+        tbl.verticalHeader().setVisible(False)
+        # Fixed row height: the view never asks the model for per-row size hints.
+        tbl.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        tbl.verticalHeader().setDefaultSectionSize(tbl.fontMetrics().height() + 8)
+        tbl.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        tbl.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        tbl.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        tbl.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        tbl.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        tbl.setSortingEnabled(True)
+        return tbl
+
     # ---------- Tracks page ----------
 
     def _build_tracks_page(self) -> QWidget:
@@ -204,16 +316,10 @@ class DatabaseTab(QWidget):
         gb_ingame = QGroupBox("In-game track quick list (availableTracks)")
         vb = QVBoxLayout(gb_ingame)
 
-        self.tbl_ingame_tracks = QTableWidget(0, 3)
-        self.tbl_ingame_tracks.setHorizontalHeaderLabels(["ID", "Name", "Source"])
-        self.tbl_ingame_tracks.verticalHeader().setVisible(False)
-        self.tbl_ingame_tracks.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.tbl_ingame_tracks.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-        self.tbl_ingame_tracks.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.tbl_ingame_tracks.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        self.tbl_ingame_tracks.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self._ingame_track_model = IdLabelTableModel(self, headers=("ID", "Name", "Source"))
+        self.tbl_ingame_tracks = self._make_id_label_view(self._ingame_track_model)
         self.tbl_ingame_tracks.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        self.tbl_ingame_tracks.itemSelectionChanged.connect(self._on_ingame_track_selected)
+        self.tbl_ingame_tracks.selectionModel().selectionChanged.connect(self._on_ingame_track_selected)
 
         vb.addWidget(self.tbl_ingame_tracks)
 
@@ -241,20 +347,18 @@ class DatabaseTab(QWidget):
         search_row = QHBoxLayout()
         search_row.addWidget(QLabel("Search:"))
         self.ed_track_search = QLineEdit()
-        self.ed_track_search.setPlaceholderText("Filter by ID or name…")
-        self.ed_track_search.textChanged.connect(self._reload_track_db_table)
+        self.ed_track_search.setPlaceholderText("Filter by ID or name (2+ characters)…")
+        self._track_filter_timer = self._make_filter_timer(self._reload_track_db_table)
+        self.ed_track_search.textChanged.connect(lambda _="": self._track_filter_timer.start())
+        # Enter applies the filter immediately.
+        self.ed_track_search.returnPressed.connect(self._track_filter_timer.stop)
+        self.ed_track_search.returnPressed.connect(self._reload_track_db_table)
         search_row.addWidget(self.ed_track_search, 1)
         vb2.addLayout(search_row)
 
-        self.tbl_track_db = QTableWidget(0, 2)
-        self.tbl_track_db.setHorizontalHeaderLabels(["ID", "Name"])
-        self.tbl_track_db.verticalHeader().setVisible(False)
-        self.tbl_track_db.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.tbl_track_db.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-        self.tbl_track_db.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.tbl_track_db.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        self.tbl_track_db.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.tbl_track_db.itemSelectionChanged.connect(self._on_track_db_selected)
+        self._track_db_model = IdLabelTableModel(self)
+        self.tbl_track_db = self._make_id_label_view(self._track_db_model)
+        self.tbl_track_db.selectionModel().selectionChanged.connect(self._on_track_db_selected)
         vb2.addWidget(self.tbl_track_db)
 
         edit_row = QHBoxLayout()
@@ -317,29 +421,54 @@ class DatabaseTab(QWidget):
             self._update_current_car_labels()
             return
 
-        # Fast heuristic: only parse blocks that contain our keys
-        for p in sorted(blocks_dir.glob("*.json")):
-            obj = try_load_json(p)
-            if not isinstance(obj, dict):
-                continue
-
-            if self._active_car_id is None and "carId" in obj:
-                v = obj.get("carId")
-                if v is not None:
-                    self._active_car_id = str(v)
-
-            if self._last_car_id is None and "lastCarId" in obj:
-                v = obj.get("lastCarId")
-                if v is not None:
-                    self._last_car_id = str(v)
-            # NOTE: We intentionally do NOT import unlocked car lists into the Database tab.
-            # Cars are labeled from Garage Unlocks / Advanced Unlocks; the Database tab stays focused.
+        paths = sorted(blocks_dir.glob("*.json"))
+        if not paths:
+            self._update_current_car_labels()
+            return
 
-            if not self._ingame_tracks and "availableTracks" in obj and isinstance(obj.get("availableTracks"), list):
-                self._ingame_tracks = [str(x) for x in (obj.get("availableTracks") or []) if x is not None]
+        # Block writes replace files (new mtime), so count + newest mtime tells
+        # whether a rescan could find anything different.
+        try:
+            sig = (len(paths), max(p.stat().st_mtime_ns for p in paths))
+        except OSError:
+            sig = None
+        cached = self._blocks_cache.get(blocks_dir)
+        if sig is not None and cached is not None and cached[0] == sig:
+            _, self._active_car_id, self._last_car_id, tracks = cached
+            self._ingame_tracks = list(tracks)
+            self._update_current_car_labels()
+            return
 
-            if self._active_car_id and self._last_car_id and self._ingame_tracks:
-                break
+        # Blocks are independent, so read/parse them on a small pool; results
+        # still arrive in path order and remaining work is cancelled once all
+        # three fields are known.
+        ex = ThreadPoolExecutor(max_workers=min(8, len(paths)))
+        try:
+            for obj in ex.map(_load_candidate_block, paths):
+                if obj is None:
+                    continue
+                if self._active_car_id is None and "carId" in obj:
+                    v = obj.get("carId")
+                    if v is not None:
+                        self._active_car_id = str(v)
+
+                if self._last_car_id is None and "lastCarId" in obj:
+                    v = obj.get("lastCarId")
+                    if v is not None:
+                        self._last_car_id = str(v)
+                # NOTE: We intentionally do NOT import unlocked car lists into the Database tab.
+                # Cars are labeled from Garage Unlocks / Advanced Unlocks; the Database tab stays focused.
+
+                if not self._ingame_tracks and "availableTracks" in obj and isinstance(obj.get("availableTracks"), list):
+                    self._ingame_tracks = [str(x) for x in (obj.get("availableTracks") or []) if x is not None]
+
+                if self._active_car_id and self._last_car_id and self._ingame_tracks:
+                    break
+        finally:
+            ex.shutdown(wait=False, cancel_futures=True)
+
+        if sig is not None:
+            self._blocks_cache[blocks_dir] = (sig, self._active_car_id, self._last_car_id, list(self._ingame_tracks))
 
         self._update_current_car_labels()
 
@@ -352,81 +481,92 @@ class DatabaseTab(QWidget):
         self._reload_track_db_table()
 
     def _update_current_car_labels(self) -> None:
-        if hasattr(self, "lbl_active_car"):
-            self.lbl_active_car.setText(self._fmt_car(self._active_car_id))
-        if hasattr(self, "lbl_last_car"):
-            self.lbl_last_car.setText(self._fmt_car(self._last_car_id))
+        if not self._ui_ready:
+            return
+        self.lbl_active_car.setText(self._fmt_car(self._active_car_id))
+        self.lbl_last_car.setText(self._fmt_car(self._last_car_id))
 
     def _fmt_car(self, car_id: Optional[str]) -> str:
         if not car_id:
             return "—"
-        # Prefer blank if not labeled? show helpful fallback
-        name = self._id_db.cars.get(str(car_id), "")
-        if name:
-            return f"{car_id} — {name}"
-        return f"{car_id} — {self._id_db.label_car(car_id)}"
+        # Ids are stored as str (see _load_from_blocks); label_car() memoizes the fallback.
+        name = self._id_db.cars.get(car_id) or self._id_db.label_car(car_id)
+        return f"{car_id} — {name}"
 
     # -------------------- Current car source --------------------
 
     def _apply_current_source(self) -> None:
         # 0 = lastCarId, 1 = carId
-        if getattr(self, "cmb_current_source", None) is None:
+        if not self._ui_ready:
             return
         use_last = self.cmb_current_source.currentIndex() == 0
         self._cur_car_id = (self._last_car_id if use_last else self._active_car_id) or None
 
         # Set edit box to existing label if present
-        if hasattr(self, "ed_cur_car_name"):
-            if self._cur_car_id:
-                self.ed_cur_car_name.setText(self._id_db.cars.get(str(self._cur_car_id), ""))
-            else:
-                self.ed_cur_car_name.setText("")
+        with QSignalBlocker(self.ed_cur_car_name):
+            self.ed_cur_car_name.setText(self._id_db.cars.get(self._cur_car_id, "") if self._cur_car_id else "")
         self._update_car_buttons_state()
 
     # -------------------- Cars DB table --------------------
 
+    def _filter_rows(
+        self,
+        kind: str,
+        state: Any,
+        filt: str,
+        all_rows: Callable[[], List[Tuple[str, Tuple[str, str]]]],
+    ) -> List[Tuple[str, str]]:
+        """Rows of `all_rows()` (search key, row pairs) whose key contains `filt`.
+
+        While `state` is unchanged and the user only extends the previous filter
+        ("fer" -> "ferr"), the answer is a subset of the last one, so only those
+        rows are re-tested instead of rebuilding and sorting the whole id set.
+        Keys come prebuilt from IdDatabase.search_index(), so a keystroke costs
+        one substring test per candidate.
+        """
+        prev_state, prev_filt, prev_hits = self._filter_cache.get(kind, (None, "", []))
+        if prev_filt and state == prev_state and filt.startswith(prev_filt):
+            source = prev_hits
+        else:
+            cached = self._all_rows_cache.get(kind)
+            if cached is not None and cached[0] == state:
+                source = cached[1]
+            else:
+                source = all_rows()
+                self._all_rows_cache[kind] = (state, source)
+        hits = [h for h in source if filt in h[0]] if filt else source
+        self._filter_cache[kind] = (state, filt, hits)
+        if len(filt) == 1:
+            # A single character matches nearly everything; show a bounded
+            # preview until the filter is selective. The full hit list is still
+            # cached so the next keystroke narrows from it.
+            hits = hits[:_SHORT_FILTER_MAX_ROWS]
+        return [r for _, r in hits]
+
     def _reload_car_db_table(self) -> None:
-        if not hasattr(self, "tbl_car_db"):
+        if not self._ui_ready:
             return
 
-        # Build union of known labeled IDs + in-game list + current ids
-        ids = set(str(k) for k in (self._id_db.cars or {}).keys())
-        if self._active_car_id:
-            ids.add(str(self._active_car_id))
-        if self._last_car_id:
-            ids.add(str(self._last_car_id))
-
-        filt = (self.ed_car_search.text() or "").strip().lower() if hasattr(self, "ed_car_search") else ""
-        ordered = sorted(ids, key=_safe_int)
-
-        self.tbl_car_db.setSortingEnabled(False)
-        self.tbl_car_db.setRowCount(0)
-        for cid in ordered:
-            name = self._id_db.cars.get(str(cid), "")
-            if filt and (filt not in str(cid).lower() and filt not in (name or "").lower()):
-                continue
-            r = self.tbl_car_db.rowCount()
-            self.tbl_car_db.insertRow(r)
-            self.tbl_car_db.setItem(r, 0, QTableWidgetItem(str(cid)))
-            self.tbl_car_db.setItem(r, 1, QTableWidgetItem(name))
-        self.tbl_car_db.setSortingEnabled(True)
+        def all_rows() -> List[Tuple[str, Tuple[str, str]]]:
+            # Union of known labeled IDs + current ids
+            extra = [cid for cid in (self._active_car_id, self._last_car_id) if cid]
+            return _indexed_rows(self._id_db.search_index("cars"), extra)
+
+        filt = (self.ed_car_search.text() or "").strip().lower()
+        state = (self._id_db.version, self._active_car_id, self._last_car_id)
+        self._car_db_model.set_rows(self._filter_rows("car", state, filt, all_rows))
 
         self._update_car_buttons_state()
 
     def _on_car_db_selected(self) -> None:
-        if not hasattr(self, "tbl_car_db"):
-            return
-        r = self.tbl_car_db.currentRow()
-        if r < 0:
-            self._sel_car_id = None
-            self.lbl_sel_car.setText("Selected ID: —")
-            self.ed_sel_car_name.setText("")
-            self._update_car_buttons_state()
+        if not self._ui_ready:
             return
-        cid = self.tbl_car_db.item(r, 0).text()
+        cid = self._car_db_model.row_id(self.tbl_car_db.currentIndex().row())
         self._sel_car_id = cid
-        self.lbl_sel_car.setText(f"Selected ID: {cid}")
-        self.ed_sel_car_name.setText(self._id_db.cars.get(str(cid), ""))
+        self.lbl_sel_car.setText(f"Selected ID: {cid or '—'}")
+        # Arrow-keying through the table: one button-state update per row, not two.
+        with QSignalBlocker(self.ed_sel_car_name):
+            self.ed_sel_car_name.setText(self._id_db.cars.get(cid, "") if cid else "")
         self._update_car_buttons_state()
 
     def _save_selected_car_name(self) -> None:
@@ -452,25 +592,21 @@ class DatabaseTab(QWidget):
         QMessageBox.information(self, "Favorites", f"Added car {self._sel_car_id} to Favorites.")
 
     def _update_car_buttons_state(self) -> None:
+        if not self._ui_ready:
+            return
         # current car buttons
-        cur_id = self._cur_car_id if hasattr(self, "cmb_current_source") else None
-        cur_name = (self.ed_cur_car_name.text() or "").strip() if hasattr(self, "ed_cur_car_name") else ""
-        if hasattr(self, "btn_save_cur_car"):
-            self.btn_save_cur_car.setEnabled(bool(cur_id) and bool(cur_name))
-        if hasattr(self, "btn_copy_cur_car"):
-            self.btn_copy_cur_car.setEnabled(bool(cur_id))
-        if hasattr(self, "btn_fav_cur_car"):
-            self.btn_fav_cur_car.setEnabled(bool(cur_id))
+        cur_id = self._cur_car_id
+        cur_name = (self.ed_cur_car_name.text() or "").strip()
+        self.btn_save_cur_car.setEnabled(bool(cur_id) and bool(cur_name))
+        self.btn_copy_cur_car.setEnabled(bool(cur_id))
+        self.btn_fav_cur_car.setEnabled(bool(cur_id))
 
         # selected car db buttons
         sel_id = bool(self._sel_car_id)
-        sel_name = (self.ed_sel_car_name.text() or "").strip() if hasattr(self, "ed_sel_car_name") else ""
-        if hasattr(self, "btn_save_sel_car"):
-            self.btn_save_sel_car.setEnabled(sel_id and bool(sel_name))
-        if hasattr(self, "btn_copy_sel_car"):
-            self.btn_copy_sel_car.setEnabled(sel_id)
-        if hasattr(self, "btn_fav_sel_car"):
-            self.btn_fav_sel_car.setEnabled(sel_id)
+        sel_name = (self.ed_sel_car_name.text() or "").strip()
+        self.btn_save_sel_car.setEnabled(sel_id and bool(sel_name))
+        self.btn_copy_sel_car.setEnabled(sel_id)
+        self.btn_fav_sel_car.setEnabled(sel_id)
 
     # Current car save/copy/fav
 
@@ -506,24 +642,13 @@ class DatabaseTab(QWidget):
     # -------------------- In-game tracks table --------------------
 
     def _reload_ingame_track_table(self) -> None:
-        if not hasattr(self, "tbl_ingame_tracks"):
+        if not self._tracks_ready:
             return
-        rows: List[Tuple[str, str]] = []
-        for tid in self._ingame_tracks:
-            rows.append((tid, "availableTracks"))
-
-        self.tbl_ingame_tracks.setSortingEnabled(False)
-        self.tbl_ingame_tracks.setRowCount(0)
-        for tid, src in rows:
-            r = self.tbl_ingame_tracks.rowCount()
-            self.tbl_ingame_tracks.insertRow(r)
-            name = self._id_db.tracks.get(str(tid), "")
-            if not name:
-                name = self._id_db.label_track(tid)
-            self.tbl_ingame_tracks.setItem(r, 0, QTableWidgetItem(str(tid)))
-            self.tbl_ingame_tracks.setItem(r, 1, QTableWidgetItem(name))
-            self.tbl_ingame_tracks.setItem(r, 2, QTableWidgetItem(src))
-        self.tbl_ingame_tracks.setSortingEnabled(True)
+        name_of = self._id_db.tracks.get
+        label_track = self._id_db.label_track
+        self._ingame_track_model.set_rows(
+            [(tid, name_of(tid) or label_track(tid), "availableTracks") for tid in self._ingame_tracks]
+        )
 
         self._update_ingame_track_buttons_state()
 
@@ -531,13 +656,9 @@ class DatabaseTab(QWidget):
         self._update_ingame_track_buttons_state()
 
     def _selected_ingame_track_id(self) -> Optional[str]:
-        if not hasattr(self, "tbl_ingame_tracks"):
-            return None
-        r = self.tbl_ingame_tracks.currentRow()
-        if r < 0:
+        if not self._tracks_ready:
             return None
-        it = self.tbl_ingame_tracks.item(r, 0)
-        return (it.text() if it else None)
+        return self._ingame_track_model.row_id(self.tbl_ingame_tracks.currentIndex().row())
 
     def _use_selected_ingame_track(self) -> None:
         tid = self._selected_ingame_track_id()
@@ -545,7 +666,8 @@ class DatabaseTab(QWidget):
             return
         self._sel_track_id = tid
         self.lbl_sel_track.setText(f"Selected ID: {tid}")
-        self.ed_sel_track_name.setText(self._id_db.tracks.get(str(tid), ""))
+        with QSignalBlocker(self.ed_sel_track_name):
+            self.ed_sel_track_name.setText(self._id_db.tracks.get(tid, ""))
         self._update_track_buttons_state()
 
     def _favorite_selected_ingame_track(self) -> None:
@@ -562,51 +684,37 @@ class DatabaseTab(QWidget):
         QGuiApplication.clipboard().setText(str(tid))
 
     def _update_ingame_track_buttons_state(self) -> None:
+        if not self._tracks_ready:
+            return
         has = bool(self._selected_ingame_track_id())
-        for attr in ("btn_name_from_ingame_track", "btn_add_ingame_track_to_favs", "btn_copy_ingame_track"):
-            if hasattr(self, attr):
-                getattr(self, attr).setEnabled(has)
+        self.btn_name_from_ingame_track.setEnabled(has)
+        self.btn_add_ingame_track_to_favs.setEnabled(has)
+        self.btn_copy_ingame_track.setEnabled(has)
 
     # -------------------- Tracks DB table --------------------
 
     def _reload_track_db_table(self) -> None:
-        if not hasattr(self, "tbl_track_db"):
+        if not self._tracks_ready:
             return
 
-        ids = set(str(k) for k in (self._id_db.tracks or {}).keys())
-        ids.update(str(x) for x in self._ingame_tracks)
+        def all_rows() -> List[Tuple[str, Tuple[str, str]]]:
+            return _indexed_rows(self._id_db.search_index("tracks"), self._ingame_tracks)
 
-        filt = (self.ed_track_search.text() or "").strip().lower() if hasattr(self, "ed_track_search") else ""
-        ordered = sorted(ids, key=_safe_int)
-
-        self.tbl_track_db.setSortingEnabled(False)
-        self.tbl_track_db.setRowCount(0)
-        for tid in ordered:
-            name = self._id_db.tracks.get(str(tid), "")
-            if filt and (filt not in str(tid).lower() and filt not in (name or "").lower()):
-                continue
-            r = self.tbl_track_db.rowCount()
-            self.tbl_track_db.insertRow(r)
-            self.tbl_track_db.setItem(r, 0, QTableWidgetItem(str(tid)))
-            self.tbl_track_db.setItem(r, 1, QTableWidgetItem(name))
-        self.tbl_track_db.setSortingEnabled(True)
+        filt = (self.ed_track_search.text() or "").strip().lower()
+        state = (self._id_db.version, tuple(self._ingame_tracks))
+        self._track_db_model.set_rows(self._filter_rows("track", state, filt, all_rows))
 
         self._update_track_buttons_state()
 
     def _on_track_db_selected(self) -> None:
-        if not hasattr(self, "tbl_track_db"):
-            return
-        r = self.tbl_track_db.currentRow()
-        if r < 0:
-            self._sel_track_id = None
-            self.lbl_sel_track.setText("Selected ID: —")
-            self.ed_sel_track_name.setText("")
-            self._update_track_buttons_state()
+        if not self._tracks_ready:
             return
-        tid = self.tbl_track_db.item(r, 0).text()
+        tid = self._track_db_model.row_id(self.tbl_track_db.currentIndex().row())
         self._sel_track_id = tid
-        self.lbl_sel_track.setText(f"Selected ID: {tid}")
-        self.ed_sel_track_name.setText(self._id_db.tracks.get(str(tid), ""))
+        self.lbl_sel_track.setText(f"Selected ID: {tid or '—'}")
+        # Arrow-keying through the table: one button-state update per row, not two.
+        with QSignalBlocker(self.ed_sel_track_name):
+            self.ed_sel_track_name.setText(self._id_db.tracks.get(tid, "") if tid else "")
         self._update_track_buttons_state()
 
     def _save_selected_track_name(self) -> None:
@@ -633,25 +741,33 @@ class DatabaseTab(QWidget):
         QMessageBox.information(self, "Favorites", f"Added track {self._sel_track_id} to Favorites.")
 
     def _update_track_buttons_state(self) -> None:
+        if not self._tracks_ready:
+            return
         sel_id = bool(self._sel_track_id)
-        sel_name = (self.ed_sel_track_name.text() or "").strip() if hasattr(self, "ed_sel_track_name") else ""
-        if hasattr(self, "btn_save_sel_track"):
-            self.btn_save_sel_track.setEnabled(sel_id and bool(sel_name))
-        if hasattr(self, "btn_copy_sel_track"):
-            self.btn_copy_sel_track.setEnabled(sel_id)
-        if hasattr(self, "btn_fav_sel_track"):
-            self.btn_fav_sel_track.setEnabled(sel_id)
+        sel_name = (self.ed_sel_track_name.text() or "").strip()
+        self.btn_save_sel_track.setEnabled(sel_id and bool(sel_name))
+        self.btn_copy_sel_track.setEnabled(sel_id)
+        self.btn_fav_sel_track.setEnabled(sel_id)
 
     # -------------------- Misc --------------------
 
     def _notify_labels_changed(self) -> None:
-        """Best-effort: ask other tabs to repaint names immediately."""
+        """Ask other tabs to repaint names; rapid saves coalesce into one pass."""
+        self._notify_timer.start()
+
+    def _do_notify_labels_changed(self) -> None:
+        """Best-effort: ask other tabs to repaint names."""
         p = self.parent()
+        # Hidden tabs the main window refreshes lazily are just marked stale.
+        lazy_pending = getattr(p, "_lazy_refresh_pending", None)
+        lazy_attrs = set(getattr(p, "_lazy_refresh_widgets", {}).values())
         # This is intentionally loose coupling; if attributes don't exist, ignore.
         for attr in ("garage_unlocks_tab", "unlock_manager_tab", "favorites_tab"):
             try:
                 tab = getattr(p, attr, None)
-                if tab and hasattr(tab, "refresh"):
+                if tab and isinstance(lazy_pending, set) and attr in lazy_attrs and not tab.isVisible():
+                    lazy_pending.add(attr)
+                elif tab and hasattr(tab, "refresh"):
                     tab.refresh()  # type: ignore[call-arg]
             except Exception:
                 pass
@@ -2,18 +2,19 @@ from __future__ import annotations
 
 import json
 import copy
+import re
 import os
-import tempfile
 import fnmatch
 import traceback
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
 
 from core.app_paths import get_writable_data_dir
-from core.fs_atomic import atomic_write_text
-from typing import Any, Dict, Optional, Tuple, List, Set
+from core.fs_atomic import atomic_write_bytes, atomic_write_text
+from typing import Any, Dict, Iterable, Optional, Tuple, List, Set
 
-from PyQt6.QtCore import Qt, QSignalBlocker
+from PyQt6.QtCore import Qt, QSignalBlocker, QTimer
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
@@ -24,7 +25,7 @@ from PyQt6.QtWidgets import (
 
 from core.id_database import IdDatabase
 from core.tunes_db import TunesDb
-from core.json_ops import read_text_any, try_load_json, load_json_file_cached, dump_json_compact, write_text_utf16le
+from core.json_ops import read_text_any, try_load_json, load_json_file_cached, dump_json_compact, dump_json_pretty_bytes, write_text_utf16le
 from core.json_ops import json_path_get, json_path_set
 
 
@@ -33,6 +34,39 @@ def _atomic_write_text(path: Path, text: str, *, encoding: str = "utf-8") -> Non
     atomic_write_text(path, text, encoding=encoding)
 
 
+# Key prefix of engine part entries in m_items (JSON keys, so always str).
+_EP_PREFIX = "engine_part_"
+
+# JSON scalar types kept as-is in engine part samples. Parsed JSON only yields
+# these exact types, so a set lookup on type(v) replaces the isinstance() chain.
+_SCALAR_TYPE_SET = frozenset({str, int, float, bool, type(None)})
+
+# Delay before a coalesced engine_parts_db.json write, and before retrying a failed one.
+_DB_FLUSH_MS = 250
+_DB_FLUSH_RETRY_MS = 5000
+
+_RE_INT = re.compile(r"^[+-]?\d+$")
+_RE_FLOAT = re.compile(r"^[+-]?\d+\.\d+$")
+
+
+# Characters of JSON shown in the raw preview pane.
+_PREVIEW_LIMIT = 20000
+
+_PREVIEW_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def _dump_preview(v: Any, limit: int = _PREVIEW_LIMIT) -> str:
+    """Pretty JSON of `v`, truncated to `limit` chars; stops encoding once past it."""
+    parts: List[str] = []
+    n = 0
+    for chunk in _PREVIEW_ENCODER.iterencode(v):
+        parts.append(chunk)
+        n += len(chunk)
+        if n >= limit:
+            break
+    return "".join(parts)[:limit]
+
+
 def _parse_jsonish(text: str) -> Any:
     """
     Parse user input into a JSON-compatible value.
@@ -53,9 +87,9 @@ def _parse_jsonish(text: str) -> Any:
         return json.loads(lowered)
     # If it looks like a number, try int/float
     try:
-        if re.match(r"^[+-]?\d+$", s):
+        if _RE_INT.match(s):
             return int(s)
-        if re.match(r"^[+-]?\d+\.\d+$", s):
+        if _RE_FLOAT.match(s):
             return float(s)
     except Exception:
         pass
@@ -67,9 +101,6 @@ def _parse_jsonish(text: str) -> Any:
         return s
 
 
-import re  # placed after helpers to keep file compact
-
-
 @dataclass
 class _KeyRow:
     key: str
@@ -84,17 +115,26 @@ class SwapKey:
     car_id: str
     tune_id: str
     engine_token: str
+    # Numeric ids parsed once (the regex only admits digits); used for sorting.
+    car_int: int = field(default=0, repr=False, compare=False)
+    tune_int: int = field(default=0, repr=False, compare=False)
 
     @property
     def engine_part_key(self) -> str:
         return f"engine_part_{self.engine_token}"
 _RE_CAR_TUNE_SWAP = re.compile(r"^(?P<car>\d+)_(?P<tune>\d+)_swap_(?P<engine>[A-Za-z0-9]+)$")
 
+# Memo of parse_car_tune_swap() results kept by EnginePartsTab; cleared past this size.
+_SWAP_PARSE_CACHE_MAX = 50_000
+_SENTINEL = object()
+
 def parse_car_tune_swap(key: str) -> Optional[SwapKey]:
     m = _RE_CAR_TUNE_SWAP.match(key)
     if not m:
         return None
-    return SwapKey(raw=key, car_id=m['car'], tune_id=m['tune'], engine_token=m['engine'])
+    car, tune = m['car'], m['tune']
+    return SwapKey(raw=key, car_id=car, tune_id=tune, engine_token=m['engine'],
+                   car_int=int(car), tune_int=int(tune))
 
 def format_car_tune_swap(car_id: str, tune_id: str, engine_part_key_or_token: str) -> str:
     car_id = str(car_id).strip()
@@ -132,15 +172,48 @@ class EnginePartsTab(QWidget):
                 self._tune_db = None
         self._m_items_path: Optional[str] = None
         self._m_items: Optional[Dict[str, Any]] = None
+        # (path, obj) located off-thread by load_data(); consumed by the next refresh().
+        self._prefetched_block: Optional[Tuple[Optional[Path], Optional[Any]]] = None
+        # (blocks dir, (file count, newest mtime_ns), best path, best obj) of the last block scan.
+        self._blocks_scan_cache: Optional[Tuple[Path, Tuple[int, int], Optional[Path], Optional[Any]]] = None
+        # block path -> (mtime_ns, size, availableCars ids, carIds ids) from _scan_unlocked_car_ids().
+        self._unlock_scan_cache: Dict[Path, Tuple[int, int, List[str], List[str]]] = {}
 
         self._known_engine_parts: Dict[str, Dict[str, Any]] = {}
+        # Stored DB label per known part, flattened once per load and kept in
+        # step by _observe_engine_parts; the list falls back to _label_key().
+        self._engine_db_labels: Dict[str, str] = {}
+        # engine_part_* keys of _known_engine_parts, kept in step with it.
+        self._known_engine_part_keys: Set[str] = set()
         # Cache for suppressing redundant reloads/log spam when multiple refreshes
         # happen during a single user action (e.g., Extract + Load Values).
         self._db_cache_path: Optional[Path] = None
         self._db_cache_mtime_ns: Optional[int] = None
         self._db_cache_loaded: bool = False
+        # Whole engine_parts_db.json document as last read/written; _observe_engine_parts
+        # merges into it (via _known_engine_parts) instead of parsing the file again.
+        self._db_doc: Optional[Dict[str, Any]] = None
+        # (m_items, fingerprint) of the last observation that left the DB up to date.
+        self._last_observed: Optional[Tuple[Any, Tuple[Any, ...]]] = None
+        # (db path, parts added) merged into _db_doc but not yet written; see flush_pending_writes().
+        self._pending_db_write: Optional[Tuple[Path, int]] = None
+        self._db_flush_timer = QTimer(self)
+        self._db_flush_timer.setSingleShot(True)
+        self._db_flush_timer.setInterval(_DB_FLUSH_MS)
+        self._db_flush_timer.timeout.connect(self.flush_pending_writes)
         self._in_save_engine_parts: Set[str] = set()
+        # (m_items, first engine_part_* dict in it) found by _make_entry_for_key().
+        self._engine_part_template: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
         self._swap_keys: Dict[str, SwapKey] = {}
+        self._swap_parse_cache: Dict[str, Optional[SwapKey]] = {}
+        # (wildcard query, compiled regex) last used by _apply_filter().
+        self._filter_rx: Optional[Tuple[str, "re.Pattern[str]"]] = None
+        # (item, lowered key, lowered text, is header) per list row, in list order;
+        # rebuilt with the list so _apply_filter() needs no per-row Qt getters.
+        self._filter_rows: List[Tuple[QListWidgetItem, str, str, bool]] = []
+        # _label_key() results, valid for IdDatabase version _label_cache_version.
+        self._label_cache: Dict[str, str] = {}
+        self._label_cache_version: Optional[int] = None
         self._other_keys: List[str] = []
         self._selected_swap_key: Optional[str] = None
         self._unlocked_car_ids: List[str] = []
@@ -175,6 +248,11 @@ class EnginePartsTab(QWidget):
         self.list_parts = QListWidget()
         self.list_parts.currentItemChanged.connect(self._on_selected)
         splitter.addWidget(self.list_parts)
+        # Shared item fonts for _populate_list (section headers / known-only parts).
+        self._f_bold = QFont()
+        self._f_bold.setBold(True)
+        self._f_italic = QFont()
+        self._f_italic.setItalic(True)
 
         right = QWidget()
         right_lay = QVBoxLayout(right)
@@ -288,18 +366,28 @@ class EnginePartsTab(QWidget):
         - Otherwise: fall back to the raw string.
         """
         s = str(key)
+        db = self._id_db
+        if db is None:
+            return s
+        # Memoized until any IdDatabase label changes (its version moves).
+        cache = self._label_cache
+        if self._label_cache_version != db.version:
+            cache.clear()
+            self._label_cache_version = db.version
+        v = cache.get(s)
+        if v is not None:
+            return v
         try:
-            if self._id_db is not None:
-                if s.isdigit():
-                    # Car label (e.g. "Car 142" or user-defined name)
-                    return self._id_db.label_car(s)
-                lbl = (self._id_db.key_labels or {}).get(s)
-                if lbl:
-                    return str(lbl)
-                return self._id_db.label_key(s)
+            if s.isdigit():
+                # Car label (e.g. "Car 142" or user-defined name)
+                v = db.label_car(s)
+            else:
+                lbl = (db.key_labels or {}).get(s)
+                v = str(lbl) if lbl else db.label_key(s)
         except Exception:
-            pass
-        return s
+            return s
+        cache[s] = v
+        return v
     def _log(self, s: str) -> None:
         """Write a message to the main window log if available."""
         try:
@@ -321,6 +409,12 @@ class EnginePartsTab(QWidget):
     # ----------------------
 
     def set_context(self, extracted_dir: Optional[Path]) -> None:
+        cached = self._blocks_scan_cache
+        if cached is not None and (extracted_dir is None or cached[0] != Path(extracted_dir) / "blocks"):
+            # Only a scan of another folder is dropped; this one may still match.
+            self._blocks_scan_cache = None
+        if extracted_dir != self.extracted_dir:
+            self._unlock_scan_cache = {}
         self.extracted_dir = extracted_dir
 
     def refresh_from_workdir(self, work_dir: Path) -> None:
@@ -328,7 +422,34 @@ class EnginePartsTab(QWidget):
         self.set_context(work_dir)
         self.refresh()
 
-    def _find_best_m_items_block(self) -> Tuple[Optional[Path], Optional[Any]]:
+    def load_data(self, work_dir: Path) -> Tuple[Path, Optional[Path], Optional[Any], Optional[Tuple[Path, Tuple[int, int], Optional[Path], Optional[Any]]]]:
+        """Locate the m_items block without touching widgets (run on a worker thread).
+
+        Tab state is not written here; the scan cache entry travels with the
+        result and apply_data() stores it on the GUI thread.
+        """
+        entry, p, obj = self._scan_best_m_items_block(work_dir)
+        return work_dir, p, obj, entry
+
+    def apply_data(self, data: Tuple[Path, Optional[Path], Optional[Any], Optional[Tuple[Path, Tuple[int, int], Optional[Path], Optional[Any]]]]) -> None:
+        """GUI-thread half of refresh_from_workdir(); reuses the block found by load_data()."""
+        work_dir, p, obj, entry = data
+        self.set_context(work_dir)
+        if entry is not None:
+            self._blocks_scan_cache = entry
+        self._prefetched_block = (p, obj)
+        self.refresh()
+
+    def _find_best_m_items_block(self, extracted_dir: Optional[Path] = None) -> Tuple[Optional[Path], Optional[Any]]:
+        """GUI-thread scan: _scan_best_m_items_block() plus storing its cache entry."""
+        entry, p, obj = self._scan_best_m_items_block(extracted_dir)
+        if entry is not None:
+            self._blocks_scan_cache = entry
+        return p, obj
+
+    def _scan_best_m_items_block(
+        self, extracted_dir: Optional[Path] = None
+    ) -> Tuple[Optional[Tuple[Path, Tuple[int, int], Optional[Path], Optional[Any]]], Optional[Path], Optional[Any]]:
         """Locate the most relevant extracted block containing an ``m_items`` dict.
 
         CarX saves often contain multiple JSON blocks. Some blocks may include an
@@ -337,20 +458,41 @@ class EnginePartsTab(QWidget):
 
         We score candidates by the number of engine_part_* keys, then by total
         size of ``m_items``. This makes the selection deterministic and stable.
+
+        Returns ``(cache entry, path, obj)``. Safe on a worker thread: it only
+        reads ``_blocks_scan_cache``; callers on the GUI thread store the entry.
         """
-        if not self.extracted_dir:
-            return None, None
+        if extracted_dir is None:
+            extracted_dir = self.extracted_dir
+        if not extracted_dir:
+            return None, None, None
 
-        blocks_dir = Path(self.extracted_dir) / "blocks"
+        blocks_dir = Path(extracted_dir) / "blocks"
         if not blocks_dir.exists() or not blocks_dir.is_dir():
-            return None, None
+            return None, None, None
 
         best_path: Optional[Path] = None
         best_obj: Optional[Any] = None
         best_score: Tuple[int, int] = (-1, -1)  # (engine_part_count, m_items_size)
 
-        for p in sorted(blocks_dir.glob("*.json")):
+        paths = sorted(blocks_dir.glob("*.json"))
+        # Block writes replace files (new mtime), so count + newest mtime tells
+        # whether a rescan could pick a different block. The directory mtime
+        # alone would miss in-place rewrites.
+        try:
+            sig: Optional[Tuple[int, int]] = (len(paths), max((p.stat().st_mtime_ns for p in paths), default=0))
+        except OSError:
+            sig = None
+        cached = self._blocks_scan_cache
+        if sig is not None and cached is not None and cached[0] == blocks_dir and cached[1] == sig:
+            return cached, cached[2], cached[3]
+
+        for p in paths:
             try:
+                # Most blocks have no m_items at all; a substring test on the
+                # (cached) decoded text is far cheaper than parsing them.
+                if '"m_items"' not in read_text_any(p):
+                    continue
                 obj = load_json_file_cached(p)
             except Exception:
                 continue
@@ -358,24 +500,22 @@ class EnginePartsTab(QWidget):
             if obj is None:
                 continue
 
+            # Every m_items dict in the block (iterative; visit order does not matter).
             found: List[Dict[str, Any]] = []
-
-            def walk(x: Any) -> None:
+            stack: List[Any] = [obj]
+            while stack:
+                x = stack.pop()
                 if isinstance(x, dict):
                     mi = x.get("m_items")
                     if isinstance(mi, dict):
                         found.append(mi)
-                    for v in x.values():
-                        walk(v)
+                    stack.extend(x.values())
                 elif isinstance(x, list):
-                    for v in x:
-                        walk(v)
-
-            walk(obj)
+                    stack.extend(x)
 
             for mi in found:
                 try:
-                    ep_count = sum(1 for k in mi.keys() if str(k).startswith("engine_part_"))
+                    ep_count = sum(1 for k in mi if k.startswith(_EP_PREFIX))
                     mi_size = len(mi)
                     score = (ep_count, mi_size)
                     if score > best_score:
@@ -385,7 +525,8 @@ class EnginePartsTab(QWidget):
                 except Exception:
                     continue
 
-        return best_path, best_obj
+        entry = (blocks_dir, sig, best_path, best_obj) if sig is not None else None
+        return entry, best_path, best_obj
 
     def _engine_db_path(self) -> Optional[Path]:
         """Return the persistent Engine Parts DB path.
@@ -414,7 +555,10 @@ class EnginePartsTab(QWidget):
         if not p:
             return
         if not p.exists():
-            # Nothing persisted yet
+            # Nothing persisted yet. A merge still waiting for its first write
+            # keeps its document; dropping it would lose that write.
+            if self._pending_db_write is None:
+                self._db_doc = None
             return
 
         # Suppress redundant reloads when the file hasn't changed.
@@ -434,29 +578,32 @@ class EnginePartsTab(QWidget):
             mtime_ns = None
 
         self._known_engine_parts = {}
+        self._engine_db_labels = {}
+        self._known_engine_part_keys = set()
+        self._db_doc = None
         try:
-            obj = json.loads(p.read_text(encoding="utf-8"))
+            obj = try_load_json(p.read_text(encoding="utf-8"))
+            self._db_doc = obj if isinstance(obj, dict) else None
             ep = obj.get("engine_parts")
             if not isinstance(ep, dict):
                 return
 
-            out: Dict[str, Dict[str, Any]] = {}
-            for k, v in ep.items():
-                ks = str(k).strip()
-                if not ks:
-                    continue
-                if isinstance(v, dict):
-                    out[ks] = v
-                else:
-                    out[ks] = {"label": str(v)}
-            self._known_engine_parts = out
+            self._known_engine_parts = self._normalize_engine_parts(ep)
+            # The document shares the normalized records, so observations can
+            # merge into _known_engine_parts in place and write _db_doc as-is.
+            obj["engine_parts"] = self._known_engine_parts
+            self._engine_db_labels = {
+                k: str(lbl) for k, v in self._known_engine_parts.items() if (lbl := v.get("label"))
+            }
+            self._known_engine_part_keys = {k for k in self._known_engine_parts if k.startswith(_EP_PREFIX)}
 
             self._log(f"[EnginePartsDb] Loaded {len(self._known_engine_parts)} parts from {p}")
         except Exception:
             # Do not crash UI if DB is malformed, but make it visible in log
             self._known_engine_parts = {}
+            self._engine_db_labels = {}
+            self._known_engine_part_keys = set()
             try:
-                import traceback
                 self._log("[EnginePartsDb] Failed to read engine_parts_db.json:\n" + traceback.format_exc())
             except Exception:
                 pass
@@ -467,6 +614,24 @@ class EnginePartsTab(QWidget):
                 self._db_cache_loaded = True
             except Exception:
                 pass
+    @staticmethod
+    def _normalize_engine_parts(ep: Dict[Any, Any]) -> Dict[str, Dict[str, Any]]:
+        out: Dict[str, Dict[str, Any]] = {}
+        for k, v in ep.items():
+            ks = str(k).strip()
+            if not ks:
+                continue
+            if isinstance(v, dict):
+                out[ks] = v
+            else:
+                out[ks] = {"label": str(v)}
+        return out
+
+    def _observe_fingerprint(self, m_items: Dict[str, Any]) -> Tuple[Any, ...]:
+        keys = frozenset(k for k in m_items if k.startswith(_EP_PREFIX))
+        labels_version = self._id_db.version if self._id_db is not None else None
+        return (keys, labels_version, self._db_cache_loaded, self._db_cache_path, self._db_cache_mtime_ns)
+
     def _observe_engine_parts(self, m_items: Dict[str, Any]) -> None:
         """Merge current-save engine_part_* entries into the persistent DB.
 
@@ -477,16 +642,20 @@ class EnginePartsTab(QWidget):
         if not p:
             return
 
-        existing: Dict[str, Any] = {}
-        if p.exists():
-            try:
-                existing = json.loads(p.read_text(encoding="utf-8"))
-            except Exception:
-                existing = {}
+        # Reuses the parsed document unless the file changed on disk.
+        self._reload_engine_parts_db()
+
+        # Same parsed block (the json_ops cache hands back the same object until
+        # the file changes), same part keys, labels and DB file: nothing to merge.
+        fp = self._observe_fingerprint(m_items)
+        last = self._last_observed
+        if last is not None and last[0] is m_items and last[1] == fp:
+            return
 
-        ep = existing.get("engine_parts")
-        if not isinstance(ep, dict):
-            ep = {}
+        # Merge straight into the loaded records (normalized, and shared with
+        # _db_doc["engine_parts"]); no per-refresh copy of the whole catalog.
+        existing: Dict[str, Any] = self._db_doc if self._db_doc is not None else {}
+        ep = self._known_engine_parts
 
         # Only persist when something material changes. The editor previously
         # wrote/reloaded the DB on every refresh, which made it look like the DB
@@ -501,33 +670,34 @@ class EnginePartsTab(QWidget):
                 for kk in preferred:
                     if kk in v and len(sample) < 8:
                         vv = v.get(kk)
-                        if isinstance(vv, (str, int, float, bool)) or vv is None:
+                        if type(vv) in _SCALAR_TYPE_SET:
                             sample[kk] = vv
                         else:
                             sample[kk] = str(vv)
                 # If still empty, take first few scalar-ish fields
                 if not sample:
-                    for kk, vv in list(v.items())[:8]:
-                        if isinstance(vv, (str, int, float, bool)) or vv is None:
+                    for kk, vv in islice(v.items(), 8):
+                        if type(vv) in _SCALAR_TYPE_SET:
                             sample[str(kk)] = vv
                         else:
                             sample[str(kk)] = str(vv)
                 return sample
             # Scalars are fine; otherwise stringify
-            if isinstance(v, (str, int, float, bool)) or v is None:
+            if type(v) in _SCALAR_TYPE_SET:
                 return v
             return str(v)
 
         added = 0
         for k, v in m_items.items():
-            ks = str(k).strip()
-            if not ks.startswith("engine_part_"):
+            ks = k.strip()
+            if not ks.startswith(_EP_PREFIX):
                 continue
 
             key_changed = False
 
             if ks not in ep:
                 ep[ks] = {}
+                self._known_engine_part_keys.add(ks)
                 added += 1
                 key_changed = True
 
@@ -541,6 +711,7 @@ class EnginePartsTab(QWidget):
             if lbl and lbl != ks:
                 if rec.get("label") != lbl:
                     rec["label"] = lbl
+                    self._engine_db_labels[ks] = lbl
                     key_changed = True
 
             # Compact sample (only update if it actually changed)
@@ -561,6 +732,7 @@ class EnginePartsTab(QWidget):
 
         if not changed:
             # No-op: avoid re-writing/re-loading the DB on every refresh.
+            self._last_observed = (m_items, fp)
             return
 
         existing["engine_parts"] = ep
@@ -574,29 +746,73 @@ class EnginePartsTab(QWidget):
         except Exception:
             pass
 
-        # Atomic write
+        # Merge in memory now; the file write is coalesced so several refreshes
+        # during one user action (e.g. Extract + Load Values) write it once.
+        self._db_doc = existing
+        self._last_observed = (m_items, fp)
+        self._pending_db_write = (p, added)
+        self._db_flush_timer.start(_DB_FLUSH_MS)
+
+    def flush_pending_writes(self) -> None:
+        """Write a coalesced engine_parts_db.json update now (e.g. on app exit)."""
+        self._db_flush_timer.stop()
+        pending = self._pending_db_write
+        if pending is None:
+            return
+        p, added = pending
+        doc = self._db_doc
+        if doc is None:
+            # The merged records live in _known_engine_parts either way.
+            doc = self._db_doc = {"engine_parts": self._known_engine_parts}
+
         try:
-            text_out = json.dumps(existing, indent=2, ensure_ascii=False)
-            _atomic_write_text(p, text_out, encoding="utf-8")
-            self._log(f"[EnginePartsDb] Saved {len(ep)} known parts (+{added}) -> {p}")
+            # Durable atomic write (unique temp file + fsync): the DB keeps parts
+            # seen in other saves, which the current save cannot rebuild.
+            atomic_write_bytes(p, dump_json_pretty_bytes(doc))
+            n = len(doc.get("engine_parts") or {})
+            self._log(f"[EnginePartsDb] Saved {n} known parts (+{added}) -> {p}")
         except Exception:
-            import traceback
             self._log("[EnginePartsDb] Failed to write engine_parts_db.json:\n" + traceback.format_exc())
+            # The merge is already in memory and later observations see no
+            # change for it, so keep the write pending and retry later.
+            self._db_flush_timer.start(_DB_FLUSH_RETRY_MS)
+            return
+        self._pending_db_write = None
+
+        # Stamping the new mtime lets the next _reload_engine_parts_db() skip
+        # re-reading our own write.
+        try:
+            self._db_cache_path = p
+            self._db_cache_mtime_ns = p.stat().st_mtime_ns
+            self._db_cache_loaded = True
+            last = self._last_observed
+            if last is not None:
+                self._last_observed = (last[0], self._observe_fingerprint(last[0]))
+        except Exception:
+            self._db_cache_loaded = False
 
-        # Reload in-memory cache
-        self._reload_engine_parts_db()
     def refresh(self) -> None:
         # Always reload DB (so swapping saves does not "lose" known keys)
         self._reload_engine_parts_db()
 
-        self.list_parts.clear()
-        self.tree.clear()
+        # Reset quietly: clearing the list would run _on_selected(None), which
+        # only repeats the clearing done here.
+        with QSignalBlocker(self.list_parts), QSignalBlocker(self.tree):
+            self.list_parts.clear()
+            self.tree.clear()
+        self._filter_rows = []
         self.raw.clear()
+        self._selected_swap_key = None
+        try:
+            self.swap_box.setVisible(False)
+        except Exception:
+            pass
         self._current_path = None
         self._current_obj = None
         self._m_items_path = None
         self._m_items = None
         self._in_save_engine_parts = set()
+        self._engine_part_template = None
         try:
             self.btn_add.setEnabled(False)
             self.btn_add_all.setEnabled(False)
@@ -607,7 +823,8 @@ class EnginePartsTab(QWidget):
         self.lbl_subtitle.setText("")
 
         # Attempt to locate m_items in the current extracted save (if any)
-        p, obj = self._find_best_m_items_block()
+        prefetched, self._prefetched_block = self._prefetched_block, None
+        p, obj = prefetched if prefetched is not None else self._find_best_m_items_block()
         if p is None or obj is None:
             # No extracted save loaded; still show known DB if requested
             self._populate_list_from_db_or_empty()
@@ -617,22 +834,20 @@ class EnginePartsTab(QWidget):
         m_items = None
         m_path = None
 
-        def walk(x: Any, path: str) -> None:
-            nonlocal m_items, m_path
-            if m_items is not None:
-                return
+        # First m_items in depth-first document order, with its JSON path.
+        # Children are pushed reversed so the explicit stack pops them in order.
+        stack: List[Tuple[Any, str]] = [(obj, "$")]
+        while stack:
+            x, path = stack.pop()
             if isinstance(x, dict):
-                if "m_items" in x and isinstance(x["m_items"], dict):
-                    m_items = x["m_items"]
-                    m_path = f"{path}.m_items" if path != "$" else "$.m_items"
-                    return
-                for k, v in x.items():
-                    walk(v, f"{path}.{k}" if path != "$" else f"$.{k}")
+                mi = x.get("m_items")
+                if isinstance(mi, dict):
+                    m_items = mi
+                    m_path = f"{path}.m_items"
+                    break
+                stack.extend(reversed([(v, f"{path}.{k}") for k, v in x.items()]))
             elif isinstance(x, list):
-                for i, v in enumerate(x):
-                    walk(v, f"{path}[{i}]")
-
-        walk(obj, "$")
+                stack.extend(reversed([(v, f"{path}[{i}]") for i, v in enumerate(x)]))
 
         if not isinstance(m_items, dict) or not m_path:
             self.raw.setPlainText("m_items found but is not a dict.")
@@ -645,19 +860,22 @@ class EnginePartsTab(QWidget):
         self._m_items = m_items
 
         # Record in-save engine parts and update DB (merge-only)
-        for k in m_items.keys():
-            ks = str(k)
-            if ks.startswith("engine_part_"):
-                self._in_save_engine_parts.add(ks)
+        self._in_save_engine_parts.update(k for k in m_items if k.startswith(_EP_PREFIX))
 
         self._observe_engine_parts(m_items)
         # Record swap/tune keys for this save and update Tunes DB (merge-only)
         self._swap_keys = {}
         self._other_keys = []
         if isinstance(m_items, dict):
-            for k in m_items.keys():
-                ks = str(k)
-                sk = parse_car_tune_swap(ks)
+            # Key classification is memoized across refreshes (SwapKey is frozen);
+            # dropped wholesale if many different saves have grown it too far.
+            cache = self._swap_parse_cache
+            if len(cache) > _SWAP_PARSE_CACHE_MAX:
+                cache.clear()
+            for ks in m_items:
+                sk = cache.get(ks, _SENTINEL)
+                if sk is _SENTINEL:
+                    sk = cache[ks] = parse_car_tune_swap(ks)
                 if sk is not None:
                     self._swap_keys[ks] = sk
                     try:
@@ -699,46 +917,64 @@ class EnginePartsTab(QWidget):
         - If unchecked: show *sections* in one list:
             ENGINE PARTS / SWAPS & TUNES / OTHER ITEMS
           This aligns with how CarX stores m_items: engine catalog + per-car tune swap keys + misc.
+
+        Row items carry a ``(kind, key)`` tuple in UserRole (see ``_list_meta``);
+        section headers carry nothing.
         """
+        lw = self.list_parts
+        had_current = lw.currentItem() is not None
+        # One repaint and no per-row signals for the whole rebuild.
+        lw.setUpdatesEnabled(False)
+        lw.blockSignals(True)
+        try:
+            self._fill_list_parts()
+        finally:
+            lw.blockSignals(False)
+            lw.setUpdatesEnabled(True)
+        if had_current:
+            # clear() dropped the selection while signals were blocked.
+            self._on_selected(lw.currentItem(), None)
+
+    def _fill_list_parts(self) -> None:
         self.list_parts.clear()
+        filter_rows: List[Tuple[QListWidgetItem, str, str, bool]] = []
+        self._filter_rows = filter_rows
+        add_filter_row = filter_rows.append
 
         m_items = self._m_items if isinstance(self._m_items, dict) else {}
-        keys_in_save = [str(k) for k in m_items.keys()]
+        # Keys are str on both sides (JSON keys / normalized DB keys); plain set ops.
+        known_engine = self._known_engine_part_keys
+        in_save_set = {k for k in m_items if k.startswith(_EP_PREFIX)}
+        in_save_engine = sorted(in_save_set)
 
-        known_engine = sorted([str(k) for k in self._known_engine_parts.keys() if str(k).startswith('engine_part_')])
-        in_save_engine = sorted([k for k in keys_in_save if k.startswith('engine_part_')])
+        add_item = self.list_parts.addItem
+        f_bold = self._f_bold
+        f_italic = self._f_italic
+        db_labels = self._engine_db_labels
 
         def add_header(title: str) -> None:
             it = QListWidgetItem(title)
             it.setFlags(Qt.ItemFlag.NoItemFlags)
-            f = it.font()
-            try:
-                f.setBold(True)
-                it.setFont(f)
-            except Exception:
-                pass
-            self.list_parts.addItem(it)
+            it.setFont(f_bold)
+            add_item(it)
+            add_filter_row((it, "", "", True))
 
         def add_row(kind: str, key: str, text: str, *, present: bool = True) -> None:
             it = QListWidgetItem(text)
-            it.setData(Qt.ItemDataRole.UserRole, {'kind': kind, 'key': key})
+            it.setData(Qt.ItemDataRole.UserRole, (kind, key))
             if not present:
                 # Visual hint: known-but-not-present
-                try:
-                    f = it.font()
-                    f.setItalic(True)
-                    it.setFont(f)
-                except Exception:
-                    pass
-            self.list_parts.addItem(it)
+                it.setFont(f_italic)
+            add_item(it)
+            add_filter_row((it, key.lower(), text.lower(), False))
 
         if self.chk_only_engine_parts.isChecked():
             # Catalog view: show union of (known DB) and (currently in save).
             # This prevents the "Only engine_part_* shows nothing" symptom when the DB was moved,
             # or when the user hasn't observed parts yet.
-            engine_keys = sorted(set(known_engine) | set(in_save_engine))
+            engine_keys = sorted(known_engine | in_save_set)
             for k in engine_keys:
-                label = self._known_engine_parts.get(k, {}).get('label') or self._label_key(k)
+                label = db_labels.get(k) or self._label_key(k)
                 present = (k in self._in_save_engine_parts)
                 txt = f"{k} — {label}" if label and label != k else k
                 add_row('engine', k, txt, present=present)
@@ -748,27 +984,21 @@ class EnginePartsTab(QWidget):
         # Sectioned view
         add_header('ENGINE PARTS')
         for k in in_save_engine:
-            label = self._known_engine_parts.get(k, {}).get('label') or self._label_key(k)
+            label = db_labels.get(k) or self._label_key(k)
             txt = f"{k} — {label}" if label and label != k else k
             add_row('engine', k, txt, present=True)
 
-        missing_engine = [k for k in known_engine if k not in in_save_engine]
+        missing_engine = sorted(known_engine - in_save_set)
         if missing_engine:
             add_header('ENGINE PARTS (KNOWN, NOT IN SAVE)')
             for k in missing_engine:
-                label = self._known_engine_parts.get(k, {}).get('label') or self._label_key(k)
+                label = db_labels.get(k) or self._label_key(k)
                 txt = f"{k} — {label}" if label and label != k else k
                 add_row('engine', k, txt, present=False)
 
         add_header('SWAPS & TUNES')
         swap_items = list(self._swap_keys.items()) if isinstance(self._swap_keys, dict) else []
-        def _swap_sort(kv):
-            sk = kv[1]
-            try:
-                return (int(sk.car_id), int(sk.tune_id), sk.engine_token)
-            except Exception:
-                return (sk.car_id, sk.tune_id, sk.engine_token)
-        for raw_key, sk in sorted(swap_items, key=_swap_sort):
+        for raw_key, sk in sorted(swap_items, key=lambda kv: (kv[1].car_int, kv[1].tune_int, kv[1].engine_token)):
             car_label = self._id_db.label_car(sk.car_id) if self._id_db else sk.car_id
             tune_name = ''
             try:
@@ -797,50 +1027,51 @@ class EnginePartsTab(QWidget):
 
         # If the user uses shell-style wildcards (* ? []), honor them.
         use_wildcard = any(ch in q_raw for ch in ('*', '?', '[', ']'))
-        pat = q.lower() if use_wildcard else ''
-
-        for i in range(self.list_parts.count()):
-            it = self.list_parts.item(i)
-
-            # Section headers: hide while filtering to reduce noise.
-            try:
-                if not bool(it.flags() & Qt.ItemFlag.ItemIsEnabled):
-                    it.setHidden(bool(q))
-                    continue
-            except Exception:
-                pass
-
-            data = it.data(Qt.ItemDataRole.UserRole)
-            if isinstance(data, dict):
-                key = str(data.get('key') or '')
+        # Compile the wildcard once per query (reused while it is unchanged, e.g.
+        # when the list is rebuilt); fnmatchcase() would go through its pattern
+        # cache for every row. match() keeps fnmatch's whole-string semantics.
+        rx = None
+        if use_wildcard:
+            cached = self._filter_rx
+            if cached is not None and cached[0] == q:
+                rx = cached[1]
             else:
-                key = str(data or '')
-            hay_key = key.lower()
-            hay_text = it.text().lower()
-
-            if not q:
-                it.setHidden(False)
-                continue
-
-            if use_wildcard:
-                ok = fnmatch.fnmatchcase(hay_key, pat) or fnmatch.fnmatchcase(hay_text, pat)
-                it.setHidden(not ok)
-            else:
-                it.setHidden(q not in hay_text)
+                rx = re.compile(fnmatch.translate(q))
+                self._filter_rx = (q, rx)
+
+        # One relayout/repaint for the whole pass. _fill_list_parts() calls this
+        # with updates already off; leave them off for it to re-enable.
+        lw = self.list_parts
+        resume = lw.updatesEnabled()
+        if resume:
+            lw.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(lw):
+                for it, hay_key, hay_text, is_header in self._filter_rows:
+                    # Section headers: hide while filtering to reduce noise.
+                    if is_header or not q:
+                        it.setHidden(bool(q))
+                    elif rx is not None:
+                        it.setHidden(rx.match(hay_key) is None and rx.match(hay_text) is None)
+                    else:
+                        it.setHidden(q not in hay_text)
+        finally:
+            if resume:
+                lw.setUpdatesEnabled(True)
 
 
     
 
     def _list_meta(self, item) -> tuple[str, str]:
-        """Return (kind, key) from a QListWidgetItem's UserRole payload."""
+        """Return (kind, key) from a QListWidgetItem's ``(kind, key)`` UserRole payload."""
         if item is None:
             return "", ""
         try:
             data = item.data(Qt.ItemDataRole.UserRole)
         except Exception:
             data = None
-        if isinstance(data, dict):
-            return str(data.get('kind') or ''), str(data.get('key') or '')
+        if type(data) is tuple:
+            return data
         return "", str(data or "")
 
     def _scan_unlocked_car_ids(self) -> List[str]:
@@ -860,36 +1091,62 @@ class EnginePartsTab(QWidget):
         found_available: List[str] = []
         found_fallback: List[str] = []
 
-        def walk_for_key(x: Any, key: str) -> Optional[list]:
-            if isinstance(x, dict):
-                if key in x and isinstance(x.get(key), list):
-                    return x.get(key)
-                for v in x.values():
-                    r = walk_for_key(v, key)
-                    if r is not None:
-                        return r
-            elif isinstance(x, list):
-                for v in x:
-                    r = walk_for_key(v, key)
-                    if r is not None:
-                        return r
-            return None
-
+        def walk_for_keys(x: Any, keys: Tuple[str, ...]) -> Dict[str, list]:
+            # First list under each key in depth-first document order, in one walk.
+            out: Dict[str, list] = {}
+            stack: List[Any] = [x]
+            while stack:
+                cur = stack.pop()
+                if isinstance(cur, dict):
+                    for key in keys:
+                        if key not in out:
+                            v = cur.get(key)
+                            if isinstance(v, list):
+                                out[key] = v
+                    if len(out) == len(keys):
+                        break
+                    stack.extend(reversed(cur.values()))
+                elif isinstance(cur, list):
+                    stack.extend(reversed(cur))
+            return out
+
+        # Per-block results are kept by (mtime_ns, size); unchanged blocks cost one stat().
+        cache = self._unlock_scan_cache
         for p in sorted(blocks_dir.glob("*.json")):
             try:
-                obj = load_json_file_cached(p, copy_obj=True)
-            except Exception:
+                st = p.stat()
+            except OSError:
                 continue
-            if obj is None:
+            hit = cache.get(p)
+            if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+                found_available.extend(hit[2])
+                found_fallback.extend(hit[3])
                 continue
 
-            lst = walk_for_key(obj, "availableCars")
-            if isinstance(lst, list) and lst:
-                found_available.extend([str(v) for v in lst if str(v).strip() != ""])
+            try:
+                # Skip blocks that mention neither container (cached text, no parse).
+                text = read_text_any(p)
+                if '"availableCars"' not in text and '"carIds"' not in text:
+                    obj = None
+                else:
+                    # Read-only walk: the shared cached object is fine, no copy needed.
+                    obj = load_json_file_cached(p)
+            except Exception:
+                continue
 
-            lst2 = walk_for_key(obj, "carIds")
-            if isinstance(lst2, list) and lst2:
-                found_fallback.extend([str(v) for v in lst2 if str(v).strip() != ""])
+            avail: List[str] = []
+            fallback: List[str] = []
+            if obj is not None:
+                hits = walk_for_keys(obj, ("availableCars", "carIds"))
+                lst = hits.get("availableCars")
+                if lst:
+                    avail = [str(v) for v in lst if str(v).strip() != ""]
+                lst2 = hits.get("carIds")
+                if lst2:
+                    fallback = [str(v) for v in lst2 if str(v).strip() != ""]
+            cache[p] = (st.st_mtime_ns, st.st_size, avail, fallback)
+            found_available.extend(avail)
+            found_fallback.extend(fallback)
 
         # Deduplicate, preserve numeric ordering if possible
         cars = found_available or found_fallback
@@ -927,13 +1184,13 @@ class EnginePartsTab(QWidget):
         cars = sorted(list(cars_set), key=lambda x: int(x) if str(x).isdigit() else str(x))
 
         # Engines: show full engine_part_* keys (align with engine-parts DB)
-        engines: List[str] = []
-        for k in sorted([str(k) for k in self._known_engine_parts.keys() if str(k).startswith('engine_part_')]):
-            engines.append(k)
+        engines: List[str] = sorted(self._known_engine_part_keys)
         # Also include engines referenced by swaps in this save
+        seen_engines = set(engines)
         for sk in (self._swap_keys or {}).values():
             ep = sk.engine_part_key
-            if ep not in engines:
+            if ep not in seen_engines:
+                seen_engines.add(ep)
                 engines.append(ep)
 
         with QSignalBlocker(self.cmb_swap_car):
@@ -1080,9 +1337,8 @@ class EnginePartsTab(QWidget):
                 return
 
             data = cur.data(Qt.ItemDataRole.UserRole)
-            if isinstance(data, dict):
-                kind = str(data.get('kind') or '')
-                key = str(data.get('key') or '')
+            if type(data) is tuple:
+                kind, key = data
             else:
                 kind = 'engine'
                 key = str(data or '')
@@ -1125,9 +1381,9 @@ class EnginePartsTab(QWidget):
                     self.raw.setPlainText(f"{key}\n\nNot present in this save. Load a save that contains it to capture a sample.")
                 else:
                     try:
-                        self.raw.setPlainText(json.dumps(sample, ensure_ascii=False, indent=2)[:20000])
+                        self.raw.setPlainText(_dump_preview(sample))
                     except Exception:
-                        self.raw.setPlainText(str(sample)[:20000])
+                        self.raw.setPlainText(str(sample)[:_PREVIEW_LIMIT])
                 return
 
             if kind == 'swap':
@@ -1157,22 +1413,27 @@ class EnginePartsTab(QWidget):
             path = f"{self._m_items_path}.{key}" if self._m_items_path else f"$.{key}"
             root = QTreeWidgetItem([key, self._preview(val)])
             root.setData(0, Qt.ItemDataRole.UserRole, path)
-            self.tree.addTopLevelItem(root)
+            # Build the subtree detached and insert it in one go, so the view
+            # sees a single row insertion instead of one per child.
             self._populate(root, val, path)
-            root.setExpanded(True)
+            self.tree.setUpdatesEnabled(False)
+            try:
+                self.tree.addTopLevelItem(root)
+                root.setExpanded(True)
+            finally:
+                self.tree.setUpdatesEnabled(True)
 
             try:
-                self.raw.setPlainText(json.dumps(val, ensure_ascii=False, indent=2)[:20000])
+                self.raw.setPlainText(_dump_preview(val))
             except Exception:
-                self.raw.setPlainText(str(val)[:20000])
+                self.raw.setPlainText(str(val)[:_PREVIEW_LIMIT])
 
             # Enable add actions based on selection/save state
             try:
                 can_edit = self._can_edit_save()
                 self.btn_add.setEnabled(can_edit and key.startswith('engine_part_') and key not in self._in_save_engine_parts)
-                known = [k for k in self._known_engine_parts.keys() if str(k).startswith('engine_part_')]
-                missing = [k for k in known if k not in self._in_save_engine_parts]
-                self.btn_add_all.setEnabled(can_edit and bool(missing))
+                has_missing = not self._known_engine_part_keys <= self._in_save_engine_parts
+                self.btn_add_all.setEnabled(can_edit and has_missing)
             except Exception:
                 pass
 
@@ -1205,12 +1466,20 @@ class EnginePartsTab(QWidget):
     def _make_entry_for_key(self, key: str) -> Dict[str, Any]:
         """Build a new engine_part_* entry matching the current save's schema."""
         # Prefer a template from the current save to preserve types (strings vs bool/int, extra fields, etc.)
+        # The first engine_part_* dict is remembered per m_items: new entries are
+        # appended, so it stays the first one and add-all does not rescan per key.
         tmpl = None
-        if isinstance(self._m_items, dict):
-            for k, v in self._m_items.items():
-                if str(k).startswith("engine_part_") and isinstance(v, dict):
-                    tmpl = v
-                    break
+        m_items = self._m_items
+        if isinstance(m_items, dict):
+            cached = self._engine_part_template
+            if cached is not None and cached[0] is m_items:
+                tmpl = cached[1]
+            else:
+                for k, v in m_items.items():
+                    if k.startswith(_EP_PREFIX) and isinstance(v, dict):
+                        tmpl = v
+                        self._engine_part_template = (m_items, v)
+                        break
 
         # Fallback: sample stored in DB
         if tmpl is None:
@@ -1270,6 +1539,38 @@ class EnginePartsTab(QWidget):
             self._mark_unsynced(f"Added {ks}")
         return ok
 
+    def _add_part_keys_to_save(self, keys: Iterable[str]) -> int:
+        """Add several keys to m_items, then write the block and update the DB once.
+
+        Returns how many keys were added (0 if the write failed).
+        """
+        if not self._can_edit_save():
+            return 0
+        m_items = self._m_items
+        if not isinstance(m_items, dict):
+            return 0
+
+        added = 0
+        for key in keys:
+            ks = str(key)
+            if ks in m_items:
+                continue
+            m_items[ks] = self._make_entry_for_key(ks)
+            self._in_save_engine_parts.add(ks)
+            added += 1
+        if not added:
+            return 0
+
+        # Persist + update DB
+        if not self._write_current_block():
+            return 0
+        try:
+            self._observe_engine_parts(m_items)
+        except Exception:
+            pass
+        self._mark_unsynced(f"Added {added} engine parts")
+        return added
+
     def _add_selected_to_save(self) -> None:
         cur = self.list_parts.currentItem()
         if cur is None:
@@ -1298,16 +1599,12 @@ class EnginePartsTab(QWidget):
             QMessageBox.information(self, "No extracted save", "Extract a save first so we can edit m_items.")
             return
 
-        known = [k for k in self._known_engine_parts.keys() if str(k).startswith("engine_part_")]
-        missing = [k for k in known if k not in self._in_save_engine_parts]
+        missing = sorted(self._known_engine_part_keys - self._in_save_engine_parts)
         if not missing:
             QMessageBox.information(self, "Nothing to add", "All known engine_part_* entries are already present in this save.")
             return
 
-        added = 0
-        for k in sorted(missing):
-            if self._add_part_key_to_save(k):
-                added += 1
+        added = self._add_part_keys_to_save(missing)
 
         self._populate_list(p_name=self._current_path.name if self._current_path else "", m_path=self._m_items_path or "")
         self._log(f"[EngineParts] Added {added} missing engine parts to current save.")
@@ -1332,8 +1629,8 @@ class EnginePartsTab(QWidget):
             item = self.list_parts.currentItem()
             if not item:
                 return
-            key = item.data(Qt.ItemDataRole.UserRole)
-            QGuiApplication.clipboard().setText(str(key))
+            _kind, key = self._list_meta(item)
+            QGuiApplication.clipboard().setText(key)
         except Exception:
             pass
 
@@ -1355,49 +1652,57 @@ class EnginePartsTab(QWidget):
 
     def _populate(self, parent: QTreeWidgetItem, v: Any, path: str) -> None:
         """Populate the tree view.
-    
+
         Leaf (scalar) nodes are editable inline (Value column). Complex nodes
         (dict/list) are containers only.
+
+        Iterative: each node's children are attached in order when the node is
+        visited, so the stack order does not affect the display order.
         """
-        if isinstance(v, dict):
-            for k in sorted(v.keys(), key=lambda s: str(s)):
-                child_path = f"{path}.{k}"
-                val = v[k]
-                child = QTreeWidgetItem([str(k), self._preview(val)])
-                child.setData(0, Qt.ItemDataRole.UserRole, child_path)
-    
-                # Make scalar leaves editable
-                if not isinstance(val, (dict, list)):
-                    child.setFlags(child.flags() | Qt.ItemFlag.ItemIsEditable)
-                    # Normalize count display if stored as bool
-                    if str(k) == "count" and isinstance(val, bool):
-                        child.setText(1, "1" if val else "0")
-                    # Bool / bool-like strings become checkable
-                    if str(k) != "count" and (isinstance(val, bool) or (isinstance(val, str) and val.lower() in ("true", "false"))):
-                        child.setFlags(child.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-                        is_true = val if isinstance(val, bool) else (val.lower() == "true")
-                        child.setCheckState(1, Qt.CheckState.Checked if is_true else Qt.CheckState.Unchecked)
-                        child.setText(1, "True" if is_true else "False")
-    
-                parent.addChild(child)
-                self._populate(child, val, child_path)
-    
-        elif isinstance(v, list):
-            for i, item in enumerate(v):
-                child_path = f"{path}[{i}]"
-                child = QTreeWidgetItem([f"[{i}]", self._preview(item)])
-                child.setData(0, Qt.ItemDataRole.UserRole, child_path)
-    
-                if not isinstance(item, (dict, list)):
-                    child.setFlags(child.flags() | Qt.ItemFlag.ItemIsEditable)
-                    if isinstance(item, bool) or (isinstance(item, str) and item.lower() in ("true", "false")):
-                        child.setFlags(child.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-                        is_true = item if isinstance(item, bool) else (item.lower() == "true")
-                        child.setCheckState(1, Qt.CheckState.Checked if is_true else Qt.CheckState.Unchecked)
-                        child.setText(1, "True" if is_true else "False")
-    
-                parent.addChild(child)
-                self._populate(child, item, child_path)
+        stack: List[Tuple[QTreeWidgetItem, Any, str]] = [(parent, v, path)]
+        while stack:
+            parent, v, path = stack.pop()
+            if isinstance(v, dict):
+                for k in sorted(v.keys(), key=lambda s: str(s)):
+                    child_path = f"{path}.{k}"
+                    val = v[k]
+                    child = QTreeWidgetItem([str(k), self._preview(val)])
+                    child.setData(0, Qt.ItemDataRole.UserRole, child_path)
+
+                    # Make scalar leaves editable
+                    if not isinstance(val, (dict, list)):
+                        child.setFlags(child.flags() | Qt.ItemFlag.ItemIsEditable)
+                        # Normalize count display if stored as bool
+                        if str(k) == "count" and isinstance(val, bool):
+                            child.setText(1, "1" if val else "0")
+                        # Bool / bool-like strings become checkable
+                        if str(k) != "count" and (isinstance(val, bool) or (isinstance(val, str) and val.lower() in ("true", "false"))):
+                            child.setFlags(child.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+                            is_true = val if isinstance(val, bool) else (val.lower() == "true")
+                            child.setCheckState(1, Qt.CheckState.Checked if is_true else Qt.CheckState.Unchecked)
+                            child.setText(1, "True" if is_true else "False")
+                    else:
+                        stack.append((child, val, child_path))
+
+                    parent.addChild(child)
+
+            elif isinstance(v, list):
+                for i, item in enumerate(v):
+                    child_path = f"{path}[{i}]"
+                    child = QTreeWidgetItem([f"[{i}]", self._preview(item)])
+                    child.setData(0, Qt.ItemDataRole.UserRole, child_path)
+
+                    if not isinstance(item, (dict, list)):
+                        child.setFlags(child.flags() | Qt.ItemFlag.ItemIsEditable)
+                        if isinstance(item, bool) or (isinstance(item, str) and item.lower() in ("true", "false")):
+                            child.setFlags(child.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+                            is_true = item if isinstance(item, bool) else (item.lower() == "true")
+                            child.setCheckState(1, Qt.CheckState.Checked if is_true else Qt.CheckState.Unchecked)
+                            child.setText(1, "True" if is_true else "False")
+                    else:
+                        stack.append((child, item, child_path))
+
+                    parent.addChild(child)
     
     def _on_tree_item_changed(self, item: QTreeWidgetItem, col: int) -> None:
         """Inline edit handler for the tree.
@@ -1455,7 +1760,7 @@ class EnginePartsTab(QWidget):
             write_text_utf16le(self._current_path, dump_json_compact(self._current_obj))
             self._mark_unsynced("Engine Parts")
             try:
-                self.raw.setPlainText(json.dumps(json_path_get(self._current_obj, str(path)), ensure_ascii=False, indent=2)[:20000])
+                self.raw.setPlainText(_dump_preview(json_path_get(self._current_obj, str(path))))
             except Exception:
                 pass
             return
@@ -1500,7 +1805,7 @@ class EnginePartsTab(QWidget):
             self._mark_unsynced("Engine Parts")
     
             try:
-                self.raw.setPlainText(json.dumps(json_path_get(self._current_obj, str(item.data(0, Qt.ItemDataRole.UserRole))), ensure_ascii=False, indent=2)[:20000])
+                self.raw.setPlainText(_dump_preview(json_path_get(self._current_obj, str(item.data(0, Qt.ItemDataRole.UserRole)))))
             except Exception:
                 pass
         except Exception as e:
@@ -1552,7 +1857,7 @@ class EnginePartsTab(QWidget):
             item.setText(1, self._preview(new_val))
             # Refresh raw preview
             try:
-                self.raw.setPlainText(json.dumps(json_path_get(self._current_obj, self._m_items_path + "." + str(self.list_parts.currentItem().data(Qt.ItemDataRole.UserRole))), ensure_ascii=False, indent=2)[:20000])
+                self.raw.setPlainText(_dump_preview(json_path_get(self._current_obj, self._m_items_path + "." + self._list_meta(self.list_parts.currentItem())[1])))
             except Exception:
                 pass
         except Exception as e:
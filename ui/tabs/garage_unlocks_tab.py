@@ -61,6 +61,20 @@ class _Dataset:
     known: Set[str]
 
 
+@dataclass
+class _UnlockState:
+    """Result of scanning extracted blocks for the unlock container (no widget access)."""
+
+    car_key: str
+    track_key: str
+    source_block: Optional[str]
+    car_elem_kind: Optional[str]
+    track_elem_kind: Optional[str]
+    cars: List[str]
+    tracks: List[str]
+    favorites: List[str]
+
+
 class GarageUnlocksTab(QWidget):
 
     """Garage & Unlocks.
@@ -248,27 +262,25 @@ class GarageUnlocksTab(QWidget):
 
     # -------------------------- Extracted save scanning -------------------------- #
 
-    def _load_state_from_blocks(self, root_dir: Path) -> Tuple[List[str], List[str], List[str]]:
+    def _adopt_state(self, state: _UnlockState) -> None:
+        self._active_car_key, self._active_track_key = state.car_key, state.track_key
+        self._active_source_block = state.source_block
+        self._car_elem_kind = state.car_elem_kind
+        self._track_elem_kind = state.track_elem_kind
+
+    def _scan_state(self, root_dir: Path, schema_mode: str) -> _UnlockState:
         """Scan extracted blocks for garage/unlock fields.
 
-        We select the *best* matching block based on the active schema
+        We select the *best* matching block based on `schema_mode`
         (Auto / availableCars+availableTracks / carIds+trackIds).
-
-        Returns:
-          (cars, tracks, favs)
-
-        Also sets:
-          - self._active_car_key / self._active_track_key
-          - self._active_source_block
-          - self._car_elem_kind / self._track_elem_kind
+        Only reads files, so it is safe to call from a worker thread.
         """
 
         blocks_dir = root_dir / "blocks"
         if not blocks_dir.exists():
-            self._active_source_block = None
-            self._car_elem_kind = None
-            self._track_elem_kind = None
-            return [], [], []
+            return _UnlockState(
+                self._active_car_key, self._active_track_key, None, None, None, [], [], []
+            )
 
         def _infer_kind(v: Any) -> Optional[str]:
             if not isinstance(v, list):
@@ -305,9 +317,9 @@ class GarageUnlocksTab(QWidget):
 
         # Resolve schema order
         wanted: List[Tuple[str, str]] = []
-        if self._schema_mode == self._SCHEMA_AVAIL:
+        if schema_mode == self._SCHEMA_AVAIL:
             wanted = [("availableCars", "availableTracks")]
-        elif self._schema_mode == self._SCHEMA_IDS:
+        elif schema_mode == self._SCHEMA_IDS:
             wanted = [("carIds", "trackIds")]
         else:
             wanted = [("availableCars", "availableTracks"), ("carIds", "trackIds")]
@@ -336,24 +348,23 @@ class GarageUnlocksTab(QWidget):
         if not picked:
             # No container found for either schema
             # Keep the keys aligned with the current mode so the user can "Create container".
-            if self._schema_mode == self._SCHEMA_IDS:
-                self._active_car_key, self._active_track_key = "carIds", "trackIds"
+            if schema_mode == self._SCHEMA_IDS:
+                car_key, track_key = "carIds", "trackIds"
             else:
-                self._active_car_key, self._active_track_key = "availableCars", "availableTracks"
-            self._active_source_block = None
-            self._car_elem_kind = None
-            self._track_elem_kind = None
-            return [], [], _dedupe_keep_order(favs)
+                car_key, track_key = "availableCars", "availableTracks"
+            return _UnlockState(car_key, track_key, None, None, None, [], [], _dedupe_keep_order(favs))
 
         car_key, track_key, src_path, cars_v, tracks_v = picked
-        self._active_car_key, self._active_track_key = car_key, track_key
-        self._active_source_block = src_path.name
-        self._car_elem_kind = _infer_kind(cars_v)
-        self._track_elem_kind = _infer_kind(tracks_v)
-
-        cars = _dedupe_keep_order(_norm_ids(cars_v))
-        tracks = _dedupe_keep_order(_norm_ids(tracks_v))
-        return cars, tracks, _dedupe_keep_order(favs)
+        return _UnlockState(
+            car_key,
+            track_key,
+            src_path.name,
+            _infer_kind(cars_v),
+            _infer_kind(tracks_v),
+            _dedupe_keep_order(_norm_ids(cars_v)),
+            _dedupe_keep_order(_norm_ids(tracks_v)),
+            _dedupe_keep_order(favs),
+        )
 
     def _render(self) -> None:
         self._fill_list(self._car_list, self._cars, kind="cars")
@@ -418,6 +429,8 @@ class GarageUnlocksTab(QWidget):
             return
 
     def _fill_list(self, lw: QListWidget, ids: List[str], *, kind: str) -> None:
+        # Suspend repaint/layout as well as signals so the rebuild costs one paint.
+        lw.setUpdatesEnabled(False)
         lw.blockSignals(True)
         try:
             lw.clear()
@@ -435,6 +448,7 @@ class GarageUnlocksTab(QWidget):
                 lw.addItem(it)
         finally:
             lw.blockSignals(False)
+            lw.setUpdatesEnabled(True)
 
     def _update_counts(self) -> None:
         self._update_count_label(self._car_count, self._collect_list(self._car_list), self._known_cars)
@@ -594,17 +608,28 @@ class GarageUnlocksTab(QWidget):
     # -------------------------- Public API -------------------------- #
 
     def refresh_from_workdir(self, work_dir: Path) -> None:
-        self._work_dir = work_dir
+        self.apply_data(self.load_data(work_dir))
+
+    def load_data(self, work_dir: Path) -> Tuple[Path, Optional[_UnlockState]]:
+        """Scan `work_dir` without touching widgets (MainWindow runs this on a worker thread)."""
         root_dir = self._resolve_root_dir(work_dir)
-        blocks_dir = root_dir / 'blocks'
-        if not blocks_dir.exists():
+        if not (root_dir / 'blocks').exists():
+            return work_dir, None
+        return work_dir, self._scan_state(root_dir, self._schema_mode)
+
+    def apply_data(self, data: Tuple[Path, Optional[_UnlockState]]) -> None:
+        """GUI-thread half of refresh_from_workdir()."""
+        work_dir, state = data
+        self._work_dir = work_dir
+        if state is None:
             self._status.setText('Blocks directory not found. Extract first.')
             return
 
         self._known_cars = self._known_ids("cars")
         self._known_tracks = self._known_ids("tracks")
 
-        self._cars, self._tracks, self._favorites = self._load_state_from_blocks(root_dir)
+        self._adopt_state(state)
+        self._cars, self._tracks, self._favorites = state.cars, state.tracks, state.favorites
 
         # update observed db with what we have
         obs = self._load_observed()
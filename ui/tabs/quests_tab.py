@@ -103,9 +103,10 @@ class QuestsTab(QWidget):
             return
 
         self.lbl_src.setText(f"Source: {found_block.name} ({len(found_val)} quests)")
-        for q in found_val:
-            if not isinstance(q, dict):
-                continue
+        quests = [q for q in found_val if isinstance(q, dict)]
+        # Size the table once; insertRow() per quest re-notifies the view every time.
+        self.tbl.setRowCount(len(quests))
+        for r, q in enumerate(quests):
             name = str(q.get("name") or q.get("id") or q.get("questId") or q.get("title") or "Quest")
             state = str(q.get("state") or q.get("status") or ("completed" if q.get("completed") else ""))
             prog = str(q.get("progress") or q.get("current") or q.get("value") or "")
@@ -118,8 +119,6 @@ class QuestsTab(QWidget):
                 rewards_s = str(rewards)
             raw_keys = ", ".join(sorted([k for k in q.keys() if isinstance(k, str)])[:12])
 
-            r = self.tbl.rowCount()
-            self.tbl.insertRow(r)
             self.tbl.setItem(r, 0, QTableWidgetItem(name))
             self.tbl.setItem(r, 1, QTableWidgetItem(state))
             self.tbl.setItem(r, 2, QTableWidgetItem(prog))
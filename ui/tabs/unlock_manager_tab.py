@@ -417,11 +417,10 @@ class UnlockManagerTab(QWidget):
         def _sort_key(s: str) -> int:
             return int(s) if s.isdigit() else 10**9
 
-        all_ids = set(records.keys()) | set(unlocked) | set(owned)
-        for _id in sorted(all_ids, key=_sort_key):
-            row = tbl.rowCount()
-            tbl.insertRow(row)
-
+        all_ids = sorted(set(records.keys()) | set(unlocked) | set(owned), key=_sort_key)
+        # Size the table once; insertRow() per id re-notifies the view every time.
+        tbl.setRowCount(len(all_ids))
+        for row, _id in enumerate(all_ids):
             chk_item = QTableWidgetItem()
             chk_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
             chk_item.setCheckState(Qt.CheckState.Checked if _id in unlocked else Qt.CheckState.Unchecked)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict
 
 from PyQt6.QtGui import QColor, QFont, QPalette
@@ -271,6 +272,9 @@ def is_dark_theme(name: str) -> bool:
     return THEMES.get(name, THEMES[DEFAULT_THEME]).dark
 
 
+# Themes are frozen (hashable) and few, so palettes and stylesheets are built
+# once per theme; switching back and forth just reuses the cached objects.
+@lru_cache(maxsize=None)
 def _palette(theme: Theme) -> QPalette:
     pal = QPalette()
     pal.setColor(QPalette.ColorRole.Window, _qcolor(theme.window))
@@ -289,6 +293,7 @@ def _palette(theme: Theme) -> QPalette:
     return pal
 
 
+@lru_cache(maxsize=None)
 def build_stylesheet(theme: Theme) -> str:
     return f"""
     * {{